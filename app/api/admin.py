@@ -1,38 +1,37 @@
 """Admin API endpoints for user management."""
 
+import asyncio
 import csv
 import io
 import uuid
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
-from pydantic import BaseModel, field_serializer
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
 from redis.asyncio import Redis
-from sqlalchemy import select
+from sqlalchemy import exists, func, select, tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import get_current_admin, get_redis
+from app.core.security import get_current_admin, get_redis, invalidate_user_context
 from app.db.session import get_db
 from app.models.user import User
+from app.services.app_settings import get_require_user_approval
 from app.services.auth import delete_all_user_sessions, hash_password
 
-router = APIRouter(prefix="/api/admin", tags=["admin"])
+router = APIRouter(prefix="/api/admin", tags=["admin"], default_response_class=ORJSONResponse)
 
 
 # Pydantic schemas
 class UserResponse(BaseModel):
-    id: str | uuid.UUID
+    id: uuid.UUID
     email: str
     is_admin: bool
     is_active: bool
     created_at: datetime
     last_login: datetime | None = None
 
-    @field_serializer("id")
-    def serialize_id(self, value: str | uuid.UUID) -> str:
-        """Convert UUID to string for JSON serialization."""
-        return str(value)
-
     class Config:
         from_attributes = True
 
@@ -42,6 +41,14 @@ class UserListResponse(BaseModel):
     total: int
 
 
+# Validates a whole page of user rows in one pass
+user_list_adapter = TypeAdapter(list[UserResponse])
+
+# Argon2 hashes a CSV import runs at once - each takes tens of MiB and a thread from the
+# default executor shared with login verification, file scans, etc.
+CSV_IMPORT_HASH_CONCURRENCY = 4
+
+
 class UpdateUserRequest(BaseModel):
     is_admin: bool | None = None
     is_active: bool | None = None
@@ -72,29 +79,53 @@ class MessageResponse(BaseModel):
 
 @router.get("/users", response_model=UserListResponse)
 async def list_users(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0, le=10000),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: datetime | None = Query(None, description="created_at of the last user seen"),
+    cursor_id: uuid.UUID | None = Query(None, description="id of the last user seen"),
     current_user: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db)
 ):
     """
     List all users (admin only).
 
-    - Paginated with skip/limit
+    - Paginated with skip/limit, or with cursor + cursor_id (created_at and id of the
+      last user seen)
     - Returns user list and total count
     """
-    # Get total count
-    count_stmt = select(User)
-    result = await db.execute(count_stmt)
-    total = len(result.scalars().all())
+    if (cursor is None) != (cursor_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="cursor and cursor_id must be given together"
+        )
 
-    # Get paginated users
-    stmt = select(User).offset(skip).limit(limit).order_by(User.created_at.desc())
+    # Get total count
+    total = await db.scalar(select(func.count()).select_from(User))
+
+    # Get paginated users - select only the response columns (no ORM hydration)
+    stmt = (
+        select(
+            User.id,
+            User.email,
+            User.is_admin,
+            User.is_active,
+            User.created_at,
+            User.last_login,
+        )
+        .order_by(User.created_at.desc(), User.id.desc())
+        .limit(limit)
+    )
+    if cursor is not None:
+        # Keyset pagination on (created_at, id) - walks ix_users_created_at_id_desc instead of
+        # discarding skipped rows; id keeps users that share a created_at from being skipped
+        stmt = stmt.where(tuple_(User.created_at, User.id) < (cursor, cursor_id))
+    else:
+        stmt = stmt.offset(skip)
     result = await db.execute(stmt)
-    users = result.scalars().all()
+    rows = result.all()
 
-    return UserListResponse(
-        users=[UserResponse.model_validate(user) for user in users],
+    return UserListResponse.model_construct(
+        users=user_list_adapter.validate_python(rows, from_attributes=True),
         total=total
     )
 
@@ -142,11 +173,11 @@ async def update_user(
 
     # Prevent demoting the last admin
     if request.is_admin is False and user.is_admin:
-        stmt = select(User).where(User.is_admin == True)  # noqa: E712
-        result = await db.execute(stmt)
-        admin_count = len(result.scalars().all())
+        other_admin_exists = await db.scalar(
+            select(exists().where(User.is_admin.is_(True), User.id != user.id))
+        )
 
-        if admin_count <= 1:
+        if not other_admin_exists:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot demote the last admin user"
@@ -166,6 +197,7 @@ async def update_user(
 
     await db.commit()
     await db.refresh(user)
+    invalidate_user_context(user.id)
 
     # Notify user if they were just activated
     if was_activated:
@@ -208,7 +240,7 @@ async def delete_user(
         )
 
     # Prevent self-deletion
-    if str(user.id) == str(current_user.id):
+    if user.id == current_user.id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot delete yourself"
@@ -216,11 +248,11 @@ async def delete_user(
 
     # Prevent deleting the last admin
     if user.is_admin:
-        stmt = select(User).where(User.is_admin == True)  # noqa: E712
-        result = await db.execute(stmt)
-        admin_count = len(result.scalars().all())
+        other_admin_exists = await db.scalar(
+            select(exists().where(User.is_admin.is_(True), User.id != user.id))
+        )
 
-        if admin_count <= 1:
+        if not other_admin_exists:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot delete the last admin user"
@@ -232,6 +264,7 @@ async def delete_user(
     # Delete user (cascades to podcasts, etc.)
     await db.delete(user)
     await db.commit()
+    invalidate_user_context(user.id)
 
     return MessageResponse(message=f"User {user.email} deleted successfully")
 
@@ -265,7 +298,7 @@ async def reset_user_password(
         )
 
     # Update password
-    user.hashed_password = hash_password(request.new_password)
+    user.hashed_password = await asyncio.to_thread(hash_password, request.new_password)
     await db.commit()
 
     # Invalidate all user sessions (security measure)
@@ -283,6 +316,67 @@ class ImportUsersResponse(BaseModel):
     skipped_users: list[str]
 
 
+async def _hash_passwords(passwords: list[str]) -> list[str]:
+    """
+    Hash passwords in worker threads (Argon2 is CPU-bound and releases the GIL), a few at a
+    time so a large import doesn't take over the shared executor
+    """
+    slots = asyncio.Semaphore(CSV_IMPORT_HASH_CONCURRENCY)
+
+    async def hash_in_slot(password: str) -> str:
+        async with slots:
+            return await asyncio.to_thread(hash_password, password)
+
+    return await asyncio.gather(*(hash_in_slot(password) for password in passwords))
+
+
+def _read_import_rows(file: UploadFile) -> tuple[int, dict[str, str], list[str], list[str]]:
+    """
+    Validate the rows of an import CSV, keeping the first occurrence of each email.
+
+    Returns:
+        Row count, email -> password for valid rows, row errors, and emails repeated in the file
+    """
+    errors = []
+    repeated = []
+    pending: dict[str, str] = {}
+    row_num = 0
+
+    # Parse CSV incrementally from the spooled upload instead of reading it all into memory
+    csv_file = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+    try:
+        for row_num, row in enumerate(csv.reader(csv_file), start=1):
+            # Skip empty rows
+            if not row or len(row) < 2:
+                errors.append(f"Row {row_num}: Invalid format (need email,password)")
+                continue
+
+            email = row[0].strip().lower()
+            password = row[1].strip()
+
+            # Validate email
+            if not email or '@' not in email:
+                errors.append(f"Row {row_num}: Invalid email '{email}'")
+                continue
+
+            # Validate password
+            if len(password) < 8:
+                errors.append(f"Row {row_num}: Password too short for '{email}' (min 8 characters)")
+                continue
+
+            # Duplicate within the CSV itself
+            if email in pending:
+                repeated.append(email)
+                continue
+
+            pending[email] = password
+    finally:
+        # Release the wrapper without closing the underlying upload file, even if decoding failed
+        csv_file.detach()
+
+    return row_num, pending, errors, repeated
+
+
 @router.post("/users/import-csv", response_model=ImportUsersResponse)
 async def import_users_csv(
     file: UploadFile = File(...),
@@ -303,74 +397,51 @@ async def import_users_csv(
             detail="File must be a CSV file"
         )
 
-    # Read file contents
-    contents = await file.read()
-    csv_text = contents.decode('utf-8')
-
-    # Parse CSV
-    csv_reader = csv.reader(io.StringIO(csv_text))
-
-    total_rows = 0
+    total_rows, pending, errors, skipped_users = _read_import_rows(file)
+    skipped = len(skipped_users)
     created = 0
-    skipped = 0
-    errors = []
     created_users = []
-    skipped_users = []
 
     # Check if user approval is required
-    from app.models.settings import AppSetting
-    setting_stmt = select(AppSetting).where(AppSetting.key == "require_user_approval")
-    setting_result = await db.execute(setting_stmt)
-    setting = setting_result.scalar_one_or_none()
-    require_approval = setting.value == "true" if setting else True
-
-    for row_num, row in enumerate(csv_reader, start=1):
-        total_rows += 1
-
-        # Skip empty rows
-        if not row or len(row) < 2:
-            errors.append(f"Row {row_num}: Invalid format (need email,password)")
-            continue
-
-        email = row[0].strip().lower()
-        password = row[1].strip()
+    require_approval = await get_require_user_approval(db)
 
-        # Validate email
-        if not email or '@' not in email:
-            errors.append(f"Row {row_num}: Invalid email '{email}'")
-            continue
-
-        # Validate password
-        if len(password) < 8:
-            errors.append(f"Row {row_num}: Password too short for '{email}' (min 8 characters)")
-            continue
-
-        # Check if user exists
-        check_stmt = select(User).where(User.email == email)
-        check_result = await db.execute(check_stmt)
-        existing_user = check_result.scalar_one_or_none()
+    # Check which users already exist in a single query
+    existing_emails: set[str] = set()
+    if pending:
+        existing_result = await db.execute(
+            select(User.email).where(User.email.in_(list(pending)))
+        )
+        existing_emails = set(existing_result.scalars().all())
 
-        if existing_user:
+    to_create = []
+    for email, password in pending.items():
+        if email in existing_emails:
             skipped += 1
             skipped_users.append(email)
             continue
+        to_create.append((email, password))
+
+    hashes = await _hash_passwords([password for _, password in to_create])
+    new_users = [
+        User(
+            email=email,
+            hashed_password=hashed_password,
+            is_admin=False,
+            is_active=not require_approval  # Active if approval not required
+        )
+        for (email, _), hashed_password in zip(to_create, hashes, strict=True)
+    ]
 
-        # Create new user
+    # Create all new users in one transaction
+    if new_users:
+        db.add_all(new_users)
         try:
-            new_user = User(
-                email=email,
-                hashed_password=hash_password(password),
-                is_admin=False,
-                is_active=not require_approval  # Active if approval not required
-            )
-            db.add(new_user)
             await db.commit()
-
-            created += 1
-            created_users.append(email)
-        except Exception as e:
+            created = len(new_users)
+            created_users = [new_user.email for new_user in new_users]
+        except IntegrityError as e:
             await db.rollback()
-            errors.append(f"Row {row_num}: Failed to create user '{email}': {str(e)}")
+            errors.append(f"Failed to create users (an email may have been registered concurrently): {e.orig}")
 
     return ImportUsersResponse(
         total_rows=total_rows,
@@ -1,17 +1,21 @@
 """Authentication API endpoints."""
 
+import asyncio
 import uuid
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import BaseModel, EmailStr, field_serializer
 from redis.asyncio import Redis
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.core.config import settings
-from app.core.security import get_current_user, get_redis
+from app.core.security import get_current_user, get_redis, invalidate_user_context
 from app.db.session import get_db
+from app.models.podcast import Notification
 from app.models.user import User
 from app.services.auth import (
     authenticate_user,
@@ -132,28 +136,28 @@ async def register(
 
         # If user requires approval, notify all admins
         if not user.is_active:
-            from sqlalchemy import select
-            from app.models.podcast import Notification
-            from app.models.user import User as UserModel
-
-            # Get all admin users
-            admin_stmt = select(UserModel).where(UserModel.is_admin == True)  # noqa: E712
+            # Get all admin user IDs (only the ID is needed for the fanout)
+            admin_stmt = select(User.id).where(User.is_admin.is_(True))
             admin_result = await db.execute(admin_stmt)
-            admins = admin_result.scalars().all()
-
-            # Create notification for each admin
-            for admin in admins:
-                notification = Notification(
-                    type="new_user_registration",
-                    title="New User Registration",
-                    message=f"{user.email} has registered and requires account activation.",
-                    level="info",
-                    read=0,
-                    user_id=admin.id
+            admin_ids = admin_result.scalars().all()
+
+            # Create notification for each admin in a single multi-row INSERT
+            if admin_ids:
+                await db.execute(
+                    insert(Notification),
+                    [
+                        {
+                            "type": "new_user_registration",
+                            "title": "New User Registration",
+                            "message": f"{user.email} has registered and requires account activation.",
+                            "level": "info",
+                            "read": 0,
+                            "user_id": admin_id,
+                        }
+                        for admin_id in admin_ids
+                    ],
                 )
-                db.add(notification)
-
-            await db.commit()
+                await db.commit()
 
         # Only create session if user is active (first user or admin-approved)
         if user.is_active:
@@ -208,29 +212,30 @@ async def login(
     - Creates session and sets cookie
     - Updates last_login timestamp
     """
-    # Authenticate user (checks is_active)
-    user = await authenticate_user(request.email, request.password, db)
+    # Authenticate user (checks password and is_active in one lookup)
+    user, reason = await authenticate_user(request.email, request.password, db)
 
-    if not user:
-        # Check if user exists but is inactive
-        from sqlalchemy import select
-        check_stmt = select(User).where(User.email == request.email.lower().strip())
-        check_result = await db.execute(check_stmt)
-        existing_user = check_result.scalar_one_or_none()
-
-        if existing_user and not existing_user.is_active:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Your account is pending admin approval. Please contact an administrator to activate your account."
-            )
+    if reason == "inactive":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Your account is pending admin approval. Please contact an administrator to activate your account."
+        )
 
+    if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
         )
 
-    # Update last login timestamp
-    user.last_login = datetime.utcnow()
+    # Update last login timestamp with a single UPDATE (timestamp generated by the database)
+    result = await db.execute(
+        update(User)
+        .where(User.id == user.id)
+        .values(last_login=func.now())
+        .returning(User.last_login)
+        .execution_options(synchronize_session=False)
+    )
+    set_committed_value(user, "last_login", result.scalar_one())
     await db.commit()
 
     # Create session
@@ -303,7 +308,9 @@ async def change_password(
     - Invalidates all other sessions (keeps current session)
     """
     # Verify current password
-    is_valid, _ = verify_password(request.current_password, current_user.hashed_password)
+    is_valid, _ = await asyncio.to_thread(
+        verify_password, request.current_password, current_user.hashed_password
+    )
     if not is_valid:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -325,7 +332,7 @@ async def change_password(
         )
 
     # Update password
-    current_user.hashed_password = hash_password(request.new_password)
+    current_user.hashed_password = await asyncio.to_thread(hash_password, request.new_password)
     await db.commit()
 
     # Invalidate all other sessions (security measure)
@@ -350,7 +357,9 @@ async def change_email(
     - Checks email is not already in use
     """
     # Verify password
-    is_valid, _ = verify_password(request.password, current_user.hashed_password)
+    is_valid, _ = await asyncio.to_thread(
+        verify_password, request.password, current_user.hashed_password
+    )
     if not is_valid:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -375,5 +384,6 @@ async def change_email(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email address is already in use"
         )
+    invalidate_user_context(current_user.id)
 
     return MessageResponse(message="Email address changed successfully")
@@ -1,20 +1,35 @@
+import asyncio
+from datetime import UTC, datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, selectinload
 
 from app.core.security import get_current_user
-from app.core.timezone import make_aware
-from app.db.session import get_db
+from app.db.session import async_session_maker, get_db
+from app.models.podcast import Chat, Episode, Podcast
 from app.models.user import User
 from app.schemas.chat import ChatRequest, ChatResponse, ChatSessionResponse
-from app.services.chat import chat_with_context
+from app.services.chat import (
+    chat_with_context,
+    get_chat_history,
+    get_or_create_chat,
+    save_chat_messages,
+)
 from app.services.vector_store import get_vector_stats
 
 router = APIRouter()
 
 
+def _utc_iso(dt: datetime) -> str:
+    """Format a database timestamp (naive UTC) as ISO 8601 with a Z suffix"""
+    if dt.tzinfo is None:
+        return dt.isoformat() + "Z"
+    return dt.astimezone(UTC).isoformat().replace("+00:00", "Z")
+
+
 @router.post("/", response_model=ChatResponse)
 async def chat(
     request: ChatRequest,
@@ -51,13 +66,16 @@ async def get_chat_sessions(
     db: AsyncSession = Depends(get_db)
 ):
     """Get all chat sessions for current user, sorted by most recently updated"""
-    from sqlalchemy.orm import selectinload
-
-    from app.models.podcast import Chat, Episode
-
+    # Only load the columns ChatSessionResponse needs
     query = (
         select(Chat)
-        .options(selectinload(Chat.episode).selectinload(Episode.podcast))
+        .options(
+            load_only(Chat.id, Chat.episode_id, Chat.title, Chat.created_at, Chat.updated_at),
+            selectinload(Chat.episode)
+            .load_only(Episode.id, Episode.title, Episode.podcast_id)
+            .selectinload(Episode.podcast)
+            .load_only(Podcast.id, Podcast.title),
+        )
         .where(Chat.user_id == current_user.id)
         .order_by(Chat.updated_at.desc())
     )
@@ -74,8 +92,6 @@ async def get_episode_chat_session(
     db: AsyncSession = Depends(get_db)
 ):
     """Get the user's chat session for a specific episode (returns null if none exists)"""
-    from app.models.podcast import Chat
-
     # Get user-specific chat session
     query = select(Chat).where(
         Chat.episode_id == episode_id,
@@ -87,7 +103,7 @@ async def get_episode_chat_session(
     if not chat:
         return None
 
-    return {"id": str(chat.id)}
+    return {"id": chat.id}
 
 
 @router.get("/sessions/{session_id}")
@@ -97,14 +113,15 @@ async def get_chat_session(
     db: AsyncSession = Depends(get_db)
 ):
     """Get a specific chat session with messages (user-specific)"""
-    from sqlalchemy.orm import selectinload
-
-    from app.models.podcast import Chat, ChatMessage
-
-    # Get user's chat session
-    query = select(Chat).options(selectinload(Chat.episode)).where(
-        Chat.id == session_id,
-        Chat.user_id == current_user.id
+    # Get user's chat session with its messages (ordered by created_at via relationship)
+    query = (
+        select(Chat)
+        .options(
+            load_only(Chat.id, Chat.episode_id, Chat.title, Chat.created_at, Chat.updated_at),
+            selectinload(Chat.episode).load_only(Episode.id, Episode.title),
+            selectinload(Chat.messages),
+        )
+        .where(Chat.id == session_id, Chat.user_id == current_user.id)
     )
     result = await db.execute(query)
     chat = result.scalar_one_or_none()
@@ -112,33 +129,26 @@ async def get_chat_session(
     if not chat:
         raise HTTPException(status_code=404, detail="Chat session not found")
 
-    # Get messages
-    messages_query = (
-        select(ChatMessage)
-        .where(ChatMessage.chat_id == session_id)
-        .order_by(ChatMessage.created_at.asc())
-    )
-    messages_result = await db.execute(messages_query)
-    messages = messages_result.scalars().all()
+    messages = chat.messages
 
     return {
         "session": {
-            "id": str(chat.id),
-            "episode_id": str(chat.episode_id),
+            "id": chat.id,
+            "episode_id": chat.episode_id,
             "title": chat.title,
-            "created_at": make_aware(chat.created_at).isoformat().replace("+00:00", "Z"),
-            "updated_at": make_aware(chat.updated_at).isoformat().replace("+00:00", "Z"),
-            "episode": {"id": str(chat.episode.id), "title": chat.episode.title}
+            "created_at": _utc_iso(chat.created_at),
+            "updated_at": _utc_iso(chat.updated_at),
+            "episode": {"id": chat.episode.id, "title": chat.episode.title}
             if chat.episode
             else None,
         },
         "messages": [
             {
-                "id": str(msg.id),
-                "session_id": str(msg.chat_id),
+                "id": msg.id,
+                "session_id": msg.chat_id,
                 "role": msg.role,
                 "content": msg.content,
-                "created_at": make_aware(msg.created_at).isoformat().replace("+00:00", "Z"),
+                "created_at": _utc_iso(msg.created_at),
             }
             for msg in messages
         ],
@@ -153,13 +163,6 @@ async def send_chat_message(
     db: AsyncSession = Depends(get_db)
 ):
     """Send a chat message for an episode (user-specific chat session)"""
-    from app.services.chat import (
-        chat_with_context,
-        get_chat_history,
-        get_or_create_chat,
-        save_chat_message,
-    )
-
     form = await request.form()
     message = form.get("message")
     session_id_param = form.get("session_id")
@@ -167,30 +170,30 @@ async def send_chat_message(
     if not message:
         raise HTTPException(status_code=400, detail="Message is required")
 
-    # Get or create user-specific chat session
-    # NOTE: get_or_create_chat needs to be updated to handle user_id
-    chat = await get_or_create_chat(db, episode_id, current_user.id)
-    session_id = str(chat.id)
-
     # Load chat history (user-specific)
     conversation_history = await get_chat_history(db, episode_id, current_user.id)
 
-    # Get AI response
-    result = await chat_with_context(
-        query=message,
-        db=db,
-        episode_id=episode_id,
-        podcast_id=None,
-        conversation_history=conversation_history,
+    async def _get_or_create_chat():
+        # AsyncSession is not safe for concurrent use, so the chat row gets its own session
+        async with async_session_maker() as chat_db:
+            return await get_or_create_chat(chat_db, episode_id, current_user.id)
+
+    # Get or create the user's chat session while the AI response is generated
+    chat, result = await asyncio.gather(
+        _get_or_create_chat(),
+        chat_with_context(
+            query=message,
+            db=db,
+            episode_id=episode_id,
+            podcast_id=None,
+            conversation_history=conversation_history,
+        ),
     )
 
-    # Save user message
-    await save_chat_message(db, chat.id, "user", message)
-
-    # Save assistant response
-    await save_chat_message(db, chat.id, "assistant", result["answer"])
+    # Save user message and assistant response together
+    await save_chat_messages(db, chat.id, [("user", message), ("assistant", result["answer"])])
 
-    return {"session_id": session_id, "response": result["answer"]}
+    return {"session_id": chat.id, "response": result["answer"]}
 
 
 @router.delete("/{chat_id}")
@@ -200,22 +203,15 @@ async def delete_chat(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a chat and all its messages (user-specific)"""
-    from sqlalchemy import delete, select
-
-    from app.models.podcast import Chat
-
-    # Check if user owns this chat
-    result = await db.execute(select(Chat).where(
-        Chat.id == chat_id,
-        Chat.user_id == current_user.id
-    ))
-    chat = result.scalar_one_or_none()
+    # Delete the chat only if the user owns it (messages will cascade delete)
+    result = await db.execute(
+        delete(Chat)
+        .where(Chat.id == chat_id, Chat.user_id == current_user.id)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
 
-    if not chat:
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Chat not found")
 
-    # Delete the chat (messages will cascade delete)
-    await db.execute(delete(Chat).where(Chat.id == chat_id))
-    await db.commit()
-
     return {"success": True}
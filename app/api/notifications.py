@@ -1,132 +1,256 @@
-from datetime import datetime, timedelta
+import asyncio
+import hashlib
+from datetime import timedelta
+from uuid import UUID
 
-from fastapi import APIRouter, Depends
-from sqlalchemy import delete, desc, select
-from sqlalchemy.ext.asyncio import AsyncSession
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import bindparam, delete, desc, func, select, update
+from sqlalchemy.ext.asyncio import AsyncConnection
 
-from app.core.security import get_current_user
-from app.core.timezone import get_utc_now, make_aware
-from app.db.session import get_db
+from app.core.security import UserContext, get_current_user_context
+from app.core.timezone import get_utc_now
+from app.db.session import engine, get_conn
 from app.models.podcast import Notification
-from app.models.user import User
+from app.services.notification_events import subscribe
 
 router = APIRouter()
 
 
+# Naive UTC timestamps from the DB are rendered with a Z suffix
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+# Rows deleted per transaction when sweeping old notifications
+SWEEP_BATCH_SIZE = 1000
+
+# Statements are built once at import and reused with bound parameters, so their compiled
+# form stays in the engine's query cache (and asyncpg's prepared statement cache).
+# "uid" rather than "user_id" - UPDATE reserves column names for its SET clause.
+_VERSION_STMT = select(
+    func.max(Notification.created_at),
+    func.count(),
+    func.count().filter(Notification.read == 0),
+).where(Notification.user_id == bindparam("uid"))
+
+_LIST_STMT = (
+    select(
+        Notification.id,
+        Notification.type,
+        Notification.title,
+        Notification.message,
+        Notification.level,
+        Notification.task_id,
+        Notification.episode_id,
+        Notification.podcast_id,
+        Notification.read,
+        Notification.created_at,
+        # Window over the whole filtered set (evaluated before LIMIT) gives the true unread total
+        func.count().filter(Notification.read == 0).over().label("unread_total"),
+    )
+    .where(Notification.user_id == bindparam("uid"))
+    .order_by(desc(Notification.created_at))
+    .limit(bindparam("limit"))
+)
+
+_MARK_READ_STMT = (
+    update(Notification)
+    .where(
+        Notification.id.in_(bindparam("ids", expanding=True)),
+        Notification.user_id == bindparam("uid")
+    )
+    .values(read=1)
+)
+
+_MARK_ALL_READ_STMT = (
+    update(Notification)
+    .where(Notification.read == 0, Notification.user_id == bindparam("uid"))
+    .values(read=1)
+)
+
+_SWEEP_STMT = delete(Notification).where(
+    Notification.id.in_(
+        select(Notification.id)
+        .where(
+            Notification.read == 1,
+            Notification.created_at < bindparam("cutoff"),
+            Notification.user_id == bindparam("uid")
+        )
+        .limit(SWEEP_BATCH_SIZE)
+        .scalar_subquery()
+    )
+)
+
+
 @router.get("/api/notifications")
 async def get_notifications(
-    limit: int = 20,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    limit: int = Query(20, ge=1, le=100),
+    current_user: UserContext = Depends(get_current_user_context),
+    conn: AsyncConnection = Depends(get_conn)
 ):
     """Get recent notifications for current user"""
-    result = await db.execute(
-        select(Notification)
-        .where(Notification.user_id == current_user.id)
-        .order_by(desc(Notification.created_at))
-        .limit(limit)
+    # Cheap one-row aggregate as a version stamp, so unchanged polls can skip the listing
+    version = await conn.execute(_VERSION_STMT, {"uid": current_user.id})
+    etag_source = f"{tuple(version.one())}|{limit}"
+    etag = f'"{hashlib.blake2b(etag_source.encode(), digest_size=8).hexdigest()}"'
+    cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=cache_headers)
+
+    # Rows are streamed from a server-side cursor and written out as they arrive,
+    # so neither the row list nor the full JSON body is held in memory
+    return StreamingResponse(
+        _stream_notifications(current_user.id, limit),
+        media_type="application/json",
+        headers=cache_headers,
     )
-    notifications = result.scalars().all()
-
-    return {
-        "notifications": [
-            {
-                "id": str(n.id),
-                "type": n.type,
-                "title": n.title,
-                "message": n.message,
-                "level": n.level,
-                "task_id": n.task_id,
-                "episode_id": str(n.episode_id) if n.episode_id else None,
-                "podcast_id": str(n.podcast_id) if n.podcast_id else None,
-                "read": n.read,
-                "created_at": make_aware(n.created_at).isoformat().replace("+00:00", "Z"),
-                "time_ago": _get_time_ago(n.created_at),
-            }
-            for n in notifications
-        ],
-        "unread_count": sum(1 for n in notifications if n.read == 0),
-    }
 
 
-@router.post("/api/notifications/{notification_id}/read")
-async def mark_notification_read(
-    notification_id: str,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+# Seconds between SSE keepalive comments (keeps proxies from closing idle streams)
+STREAM_KEEPALIVE_SECONDS = 25
+
+
+@router.get("/api/notifications/stream")
+async def stream_notifications(
+    request: Request,
+    limit: int = Query(20, ge=1, le=100),
+    current_user: UserContext = Depends(get_current_user_context),
 ):
-    """Mark a notification as read (user-specific)"""
-    from uuid import UUID
+    """
+    Server-sent events stream of the notifications listing (user-specific).
 
-    result = await db.execute(
-        select(Notification).where(
-            Notification.id == UUID(notification_id),
-            Notification.user_id == current_user.id
-        )
+    Sends the current listing on connect and again whenever the user's notifications
+    change, instead of the client polling GET /api/notifications.
+    """
+    user_id = current_user.id
+
+    async def events():
+        async with subscribe(user_id) as changes:
+            while True:
+                listing = b"".join([chunk async for chunk in _stream_notifications(user_id, limit)])
+                yield b"event: notifications\ndata: " + listing + b"\n\n"
+
+                while True:
+                    try:
+                        await asyncio.wait_for(changes.get(), timeout=STREAM_KEEPALIVE_SECONDS)
+                        break
+                    except TimeoutError:
+                        if await request.is_disconnected():
+                            return
+                        yield b": keepalive\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
-    notification = result.scalar_one_or_none()
 
-    if notification:
-        notification.read = 1
-        await db.commit()
 
-    return {"success": True}
+@router.post("/api/notifications/read")
+async def mark_notifications_read(
+    notification_ids: list[UUID] = Body(..., max_length=500),
+    current_user: UserContext = Depends(get_current_user_context),
+    conn: AsyncConnection = Depends(get_conn)
+):
+    """Mark several notifications as read in one UPDATE (user-specific)"""
+    updated = await _mark_read(conn, current_user.id, notification_ids)
+    return {"success": updated > 0, "updated": updated}
+
+
+@router.post("/api/notifications/{notification_id}/read")
+async def mark_notification_read(
+    notification_id: UUID,
+    current_user: UserContext = Depends(get_current_user_context),
+    conn: AsyncConnection = Depends(get_conn)
+):
+    """Mark a notification as read (user-specific)"""
+    updated = await _mark_read(conn, current_user.id, [notification_id])
+    return {"success": updated > 0}
 
 
 @router.post("/api/notifications/read-all")
 async def mark_all_read(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: UserContext = Depends(get_current_user_context),
+    conn: AsyncConnection = Depends(get_conn)
 ):
     """Mark all notifications as read (user-specific)"""
-    from sqlalchemy import update
-
-    await db.execute(
-        update(Notification)
-        .values(read=1)
-        .where(Notification.read == 0, Notification.user_id == current_user.id)
-    )
-    await db.commit()
+    await conn.execute(_MARK_ALL_READ_STMT, {"uid": current_user.id})
+    await conn.commit()
 
     return {"success": True}
 
 
 @router.delete("/api/notifications/clear")
 async def clear_notifications(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    background_tasks: BackgroundTasks,
+    current_user: UserContext = Depends(get_current_user_context),
 ):
     """Clear all read notifications older than 7 days (user-specific)"""
-    cutoff = get_utc_now() - timedelta(days=7)
-    # Convert to naive datetime for database comparison (database stores naive UTC)
-    cutoff_naive = cutoff.replace(tzinfo=None)
+    # Runs after the response is sent so a large sweep never blocks the caller
+    background_tasks.add_task(_sweep_old_read, current_user.id)
 
-    await db.execute(
-        delete(Notification).where(
-            Notification.read == 1,
-            Notification.created_at < cutoff_naive,
-            Notification.user_id == current_user.id
-        )
+    return {"success": True, "queued": True}
+
+
+async def _sweep_old_read(user_id: UUID) -> None:
+    """Delete the user's read notifications older than 7 days in short batches"""
+    params = {"uid": user_id, "cutoff": get_utc_now() - timedelta(days=7)}
+
+    # Own connection - the request's connection is released once the response is sent.
+    # Committing per batch keeps row locks short.
+    async with engine.connect() as conn:
+        while True:
+            result = await conn.execute(_SWEEP_STMT, params)
+            await conn.commit()
+            if result.rowcount < SWEEP_BATCH_SIZE:
+                break
+
+
+def _notification_json(r) -> bytes:
+    """Serialize one notification row; UUIDs and datetimes are handled natively by orjson"""
+    return orjson.dumps(
+        {
+            "id": r["id"],
+            "type": r["type"],
+            "title": r["title"],
+            "message": r["message"],
+            "level": r["level"],
+            "task_id": r["task_id"],
+            "episode_id": r["episode_id"],
+            "podcast_id": r["podcast_id"],
+            "read": r["read"],
+            # Relative "time ago" labels are computed client-side from created_at
+            "created_at": r["created_at"],
+        },
+        option=ORJSON_OPTIONS,
     )
-    await db.commit()
 
-    return {"success": True}
 
+async def _stream_notifications(user_id: UUID, limit: int):
+    """Yield the notifications listing JSON ({"notifications": [...], "unread_count": n}) in chunks"""
+    unread_count = 0
+    yield b'{"notifications":['
+    # Own connection - the request's dependency may be closed before streaming finishes
+    async with engine.connect() as conn:
+        result = await conn.stream(_LIST_STMT, {"uid": user_id, "limit": limit})
+        first = True
+        async for r in result.mappings():
+            if first:
+                unread_count = r["unread_total"]
+            yield (b"" if first else b",") + _notification_json(r)
+            first = False
+    yield b'],"unread_count":' + orjson.dumps(unread_count) + b"}"
+
+
+async def _mark_read(conn: AsyncConnection, user_id: UUID, notification_ids: list[UUID]) -> int:
+    """Mark the user's notifications with the given IDs as read, returning the number updated"""
+    if not notification_ids:
+        return 0
+
+    result = await conn.execute(_MARK_READ_STMT, {"ids": notification_ids, "uid": user_id})
+    await conn.commit()
+    return result.rowcount
 
-def _get_time_ago(dt: datetime) -> str:
-    """Convert datetime to relative time string"""
-    now = get_utc_now()
-    # Both datetimes are naive UTC, so we can subtract directly
-    diff = now - dt
-
-    if diff.total_seconds() < 60:
-        return "just now"
-    if diff.total_seconds() < 3600:
-        minutes = int(diff.total_seconds() / 60)
-        return f"{minutes}m ago"
-    if diff.total_seconds() < 86400:
-        hours = int(diff.total_seconds() / 3600)
-        return f"{hours}h ago"
-    if diff.days < 7:
-        return f"{diff.days}d ago"
-    return dt.strftime("%b %d")
@@ -1,27 +1,52 @@
+import asyncio
+import hashlib
+import heapq
+import os
+import re
 import shutil
+import time
+from functools import lru_cache
 from pathlib import Path
 from uuid import UUID
 
+import orjson
 import structlog
-from fastapi import APIRouter, Body, Depends, File, HTTPException, Query, Request, UploadFile
+from celery import group
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Body,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+)
 from fastapi.responses import HTMLResponse, Response
-from pydantic import BaseModel
-from sqlalchemy import func, select
+from pydantic import BaseModel, Field
+from redis.asyncio import Redis
+from sqlalchemy import String, cast, func, insert, select, text, update
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.api.podcasts_auth import (
     apply_user_filter,
+    check_episode_ownership,
+    check_podcast_ownership,
     get_user_storage_path,
+    invalidate_user_podcast_ids,
     verify_episode_ownership,
     verify_podcast_ownership,
     verify_term_ownership,
 )
-from app.core.security import get_current_user
+from app.core.config import settings
+from app.core.security import get_current_user, get_redis
 from app.core.timezone import get_utc_now
-from app.db.session import get_db
+from app.db.session import async_session_maker, engine, get_db, index_exists
 from app.exceptions import ValidationError
-from app.models.podcast import Episode, Podcast, Summary, Term, Transcription
+from app.models.podcast import TERM_SOURCE_RANK_SQL, Episode, Podcast, Summary, Term, Transcription
 from app.models.user import User
 from app.schemas.podcast import (
     EpisodeResponse,
@@ -31,7 +56,7 @@ from app.schemas.podcast import (
     TermResponse,
     TranscriptionResponse,
 )
-from app.services import rss_parser
+from app.services import playback_progress, rss_parser
 from app.services.validators import validate_external_url
 from app.tasks.episode_processing import process_episode_task
 
@@ -39,6 +64,40 @@ logger = structlog.get_logger(__name__)
 router = APIRouter()
 episodes_router = APIRouter()
 
+# Seconds a user's category list stays cached (also invalidated when their podcasts change)
+CATEGORIES_CACHE_TTL = 60
+
+# user_id -> (expires_at, categories)
+_categories_cache: dict[UUID, tuple[float, list[str]]] = {}
+
+
+# Seconds rendered extraction-progress term HTML stays in Redis (keys change whenever the visible terms do)
+TERMS_HTML_CACHE_TTL = 300
+
+# Seconds a term embedding stays in Redis (the same term text is often added to many episodes)
+TERM_EMBEDDING_CACHE_TTL = 86400
+
+# Podcast columns returned by the list endpoints (episodes are never loaded for lists)
+PODCAST_LIST_COLUMNS = (
+    Podcast.id,
+    Podcast.rss_url,
+    Podcast.title,
+    Podcast.description,
+    Podcast.author,
+    Podcast.image_url,
+    Podcast.category,
+    Podcast.episode_count,
+    Podcast.processed_count,
+    Podcast.latest_episode_date,
+    Podcast.created_at,
+    Podcast.updated_at,
+)
+
+
+def _invalidate_categories(user_id: UUID):
+    """Drop a user's cached categories after their podcasts were added, refreshed or deleted"""
+    _categories_cache.pop(user_id, None)
+
 
 @router.post("", response_model=PodcastResponse)
 async def add_podcast(
@@ -52,16 +111,19 @@ async def add_podcast(
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=f"Invalid RSS URL: {e!s}")
 
-    # Check if THIS USER already has this podcast
+    # Check if THIS USER already has this podcast - id only, the full row is loaded just for a repeat add
     result = await db.execute(
-        select(Podcast).where(
+        select(Podcast.id)
+        .where(
             Podcast.rss_url == podcast_data.rss_url,
             Podcast.user_id == current_user.id
         )
+        .limit(1)
     )
-    existing = result.scalar_one_or_none()
+    existing_id = result.scalar_one_or_none()
 
-    if existing:
+    if existing_id:
+        existing = await db.get(Podcast, existing_id)
         # Return the existing podcast instead of raising an error (idempotent operation)
         logger.info("podcast_already_exists", user_id=str(current_user.id), podcast_id=str(existing.id), rss_url=podcast_data.rss_url)
         return PodcastResponse(
@@ -76,7 +138,8 @@ async def add_podcast(
         )
 
     try:
-        feed_data = rss_parser.parse_podcast_feed(podcast_data.rss_url)
+        # Blocking HTTP fetch + XML parse - keep it off the event loop
+        feed_data = await asyncio.to_thread(rss_parser.parse_podcast_feed, podcast_data.rss_url)
     except ValueError as e:
         # RSS parsing error - return 400 with helpful message
         error_msg = str(e)
@@ -101,9 +164,9 @@ async def add_podcast(
             **feed_data
         )
 
+        # Podcast, episodes and notification go in one transaction - flush for the podcast id
         db.add(podcast)
-        await db.commit()
-        await db.refresh(podcast)
+        await db.flush()
 
         await fetch_episodes(podcast.id, podcast_data.rss_url, db)
 
@@ -121,6 +184,7 @@ async def add_podcast(
         )
         db.add(notification)
         await db.commit()
+        _invalidate_categories(current_user.id)
 
         # Reload podcast with episodes relationship
         result = await db.execute(
@@ -153,6 +217,10 @@ async def list_categories(
     db: AsyncSession = Depends(get_db)
 ):
     """Get all unique podcast categories for current user's podcasts"""
+    cached = _categories_cache.get(current_user.id)
+    if cached and cached[0] > time.monotonic():
+        return {"categories": cached[1]}
+
     query = (
         select(Podcast.category)
         .where(Podcast.category.isnot(None))
@@ -165,6 +233,7 @@ async def list_categories(
 
     result = await db.execute(query)
     categories = [row[0] for row in result.all()]
+    _categories_cache[current_user.id] = (time.monotonic() + CATEGORIES_CACHE_TTL, categories)
     return {"categories": categories}
 
 
@@ -178,8 +247,8 @@ async def list_podcasts(
 ):
     from sqlalchemy import asc, desc, or_
 
-    # Build base query - don't eagerly load episodes
-    query = select(Podcast)
+    # Select only the response columns - rows map straight onto PodcastResponse
+    query = select(*PODCAST_LIST_COLUMNS)
 
     # Filter by user (admins see all, users see only their own)
     query = apply_user_filter(query, current_user)
@@ -212,49 +281,45 @@ async def list_podcasts(
         query = query.order_by(desc(Podcast.episode_count))
 
     result = await db.execute(query)
-    podcasts = list(result.scalars().all())
 
-    # Convert to response format without triggering lazy loads
-    return [
-        PodcastResponse.model_construct(
-            id=p.id,
-            rss_url=p.rss_url,
-            title=p.title,
-            description=p.description,
-            author=p.author,
-            image_url=p.image_url,
-            category=p.category,
-            episode_count=p.episode_count,
-            processed_count=p.processed_count,
-            latest_episode_date=p.latest_episode_date,
-            created_at=p.created_at,
-            updated_at=p.updated_at,
-            episodes=[],  # Don't load episodes for list view
-        )
-        for p in podcasts
-    ]
+    # Don't load episodes for list view
+    return [PodcastResponse.model_construct(**row, episodes=[]) for row in result.mappings()]
 
 
 @router.get("/episodes/processed")
 async def list_processed_episodes(
     search: str | None = None,
     sort: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get all episodes that have been AI processed (with summaries), sorted by processing date"""
-    from sqlalchemy import or_
+    """Get a page of episodes that have been AI processed (with summaries), sorted by processing date"""
+    from sqlalchemy import desc, or_
 
-    # Get episodes with summaries, including podcast and summary info
+    # Get episodes with summaries, projecting just the podcast, summary and transcription columns used below
     query = (
-        select(Episode)
+        select(
+            Episode.id,
+            Episode.podcast_id,
+            Episode.title,
+            Episode.description,
+            Episode.audio_url,
+            Episode.duration,
+            Episode.published_at,
+            Episode.created_at,
+            Podcast.image_url,
+            Podcast.title.label("podcast_title"),
+            Podcast.author.label("podcast_author"),
+            Summary.id.label("summary_id"),
+            Summary.text.label("summary_text"),
+            Summary.created_at.label("processed_at"),
+            Transcription.id.label("transcription_id"),
+        )
         .join(Summary, Summary.episode_id == Episode.id)
         .join(Podcast, Podcast.id == Episode.podcast_id)
-        .options(
-            selectinload(Episode.transcription),
-            selectinload(Episode.summary),
-            selectinload(Episode.podcast),
-        )
+        .outerjoin(Transcription, Transcription.episode_id == Episode.id)
     )
 
     # Filter by user - all users (including admins) only see their own content
@@ -272,41 +337,42 @@ async def list_processed_episodes(
             )
         )
 
-    result = await db.execute(query)
-    episodes = list(result.scalars().all())
-
     # Sort by processing date (summary created_at) - default is most recent first
     sort_by = sort or "processed_desc"
     if sort_by == "processed_desc":
-        episodes.sort(key=lambda e: e.summary.created_at if e.summary else "", reverse=True)
+        query = query.order_by(desc(Summary.created_at))
     elif sort_by == "processed_asc":
-        episodes.sort(key=lambda e: e.summary.created_at if e.summary else "")
+        query = query.order_by(Summary.created_at)
     elif sort_by == "title_asc":
-        episodes.sort(key=lambda e: e.title.lower())
+        query = query.order_by(func.lower(Episode.title))
     elif sort_by == "title_desc":
-        episodes.sort(key=lambda e: e.title.lower(), reverse=True)
+        query = query.order_by(desc(func.lower(Episode.title)))
+
+    # Id tiebreaker keeps pages stable across requests
+    query = query.order_by(Episode.id).limit(limit).offset(offset)
+
+    result = await db.execute(query)
 
     # Return episodes with podcast info
     return [
         {
-            "id": str(e.id),
-            "podcast_id": str(e.podcast_id),
-            "title": e.title,
-            "description": e.description,
-            "audio_url": e.audio_url,
-            "duration": e.duration,
-            "published_at": e.published_at.isoformat() if e.published_at else None,
-            "created_at": e.created_at.isoformat(),
-            "image_url": e.podcast.image_url if e.podcast else None,
-            "podcast_title": e.podcast.title if e.podcast else None,
-            "podcast_author": e.podcast.author if e.podcast else None,
-            "summary": {"id": str(e.summary.id), "text": e.summary.text} if e.summary else None,
-            "transcription": {"id": str(e.transcription.id), "text": e.transcription.text}
-            if e.transcription
-            else None,
-            "processed_at": e.summary.created_at.isoformat() if e.summary else None,
+            "id": str(row.id),
+            "podcast_id": str(row.podcast_id),
+            "title": row.title,
+            "description": row.description,
+            "audio_url": row.audio_url,
+            "duration": row.duration,
+            "published_at": row.published_at.isoformat() if row.published_at else None,
+            "created_at": row.created_at.isoformat(),
+            "image_url": row.image_url,
+            "podcast_title": row.podcast_title,
+            "podcast_author": row.podcast_author,
+            "summary": {"id": str(row.summary_id), "text": row.summary_text},
+            # Full transcript text is fetched separately by the episode page - lists only flag it
+            "transcription": {"id": str(row.transcription_id)} if row.transcription_id else None,
+            "processed_at": row.processed_at.isoformat(),
         }
-        for e in episodes
+        for row in result
     ]
 
 
@@ -345,17 +411,25 @@ async def hybrid_search_episodes(
     if not query or not query.strip():
         return []
 
-    # STAGE 1: Exact text search in transcriptions (whole word match)
-    # Use regex word boundaries to match whole words only
-    # \m and \M are PostgreSQL word boundary markers
-    search_pattern = rf"\m{query}\M"
+    # STAGE 1: Full-text search in transcriptions (GIN-indexed tsvector, stemmed word match)
+    # ts_headline builds the match snippet in the same query
+    ts_query = func.websearch_to_tsquery("english", query)
     exact_search_query = (
-        select(Episode, Transcription.text)
+        select(
+            Episode,
+            func.ts_headline(
+                "english",
+                Transcription.text,
+                ts_query,
+                "StartSel=, StopSel=, MaxFragments=1, MinWords=20, MaxWords=50",
+            ).label("snippet"),
+        )
         .join(Transcription, Transcription.episode_id == Episode.id)
         .join(Podcast, Podcast.id == Episode.podcast_id)
-        .where(Transcription.text.op("~*")(search_pattern))  # ~* is case-insensitive regex match
+        .where(Transcription.text_tsv.op("@@")(ts_query))
         .options(
-            selectinload(Episode.transcription),
+            # Only whether a transcript exists is returned - skip loading its text
+            selectinload(Episode.transcription).load_only(Transcription.id),
             selectinload(Episode.summary),
             selectinload(Episode.podcast),
         )
@@ -366,39 +440,28 @@ async def hybrid_search_episodes(
     if not current_user.is_admin:
         exact_search_query = exact_search_query.where(Podcast.user_id == current_user.id)
 
-    exact_result = await db.execute(exact_search_query)
+    # STAGE 2 (runs concurrently with stage 1): Semantic vector search.
+    # AsyncSession is not safe for concurrent use, so the vector search gets its own session.
+    async def _vector_search():
+        async with async_session_maker() as vector_db:
+            return await search_vectors(
+                query=query, db=vector_db, episode_id=None, podcast_id=None, limit=limit * 3
+            )
+
+    exact_result, vector_results = await asyncio.gather(
+        db.execute(exact_search_query), _vector_search()
+    )
     exact_matches = exact_result.all()
 
     # Build map of exact match episodes with snippets
-    exact_episodes = {}
-    for episode, transcript_text in exact_matches:
-        # Find the position of the query in transcript and extract snippet
-        query_lower = query.lower()
-        text_lower = transcript_text.lower()
-        match_pos = text_lower.find(query_lower)
-
-        if match_pos != -1:
-            # Extract snippet around the match (150 chars before, 150 after)
-            start = max(0, match_pos - 150)
-            end = min(len(transcript_text), match_pos + len(query) + 150)
-            snippet = transcript_text[start:end]
-            if start > 0:
-                snippet = "..." + snippet
-            if end < len(transcript_text):
-                snippet = snippet + "..."
-        else:
-            snippet = transcript_text[:300] + "..."
-
-        exact_episodes[str(episode.id)] = {
+    exact_episodes = {
+        str(episode.id): {
             "episode": episode,
-            "snippet": snippet,
+            "snippet": f"...{snippet}...",
             "exact_match": True,
         }
-
-    # STAGE 2: Semantic vector search
-    vector_results = await search_vectors(
-        query=query, db=db, episode_id=None, podcast_id=None, limit=limit * 3
-    )
+        for episode, snippet in exact_matches
+    }
 
     # Group semantic results by episode_id
     semantic_matches = defaultdict(list)
@@ -411,15 +474,23 @@ async def hybrid_search_episodes(
     # Get semantic episode IDs (not already in exact matches)
     semantic_episode_ids = list(semantic_matches.keys())[:limit]
 
-    # Fetch semantic match episodes
+    # Fetch semantic match episodes, returned in vector-search rank order (best match first)
     semantic_episodes = {}
     if semantic_episode_ids:
+        ranked_ids = (
+            func.unnest(
+                cast(semantic_episode_ids, postgresql.ARRAY(postgresql.UUID(as_uuid=True)))
+            )
+            .table_valued("id", with_ordinality="rank")
+            .render_derived(name="ranked_ids")
+        )
         semantic_query = (
             select(Episode)
+            .join(ranked_ids, ranked_ids.c.id == Episode.id)
             .join(Podcast, Podcast.id == Episode.podcast_id)
-            .where(Episode.id.in_(semantic_episode_ids))
+            .order_by(ranked_ids.c.rank)
             .options(
-                selectinload(Episode.transcription),
+                selectinload(Episode.transcription).load_only(Transcription.id),
                 selectinload(Episode.summary),
                 selectinload(Episode.podcast),
             )
@@ -446,29 +517,20 @@ async def hybrid_search_episodes(
                 "similarity_score": best_match.get("similarity_score", 0),
             }
 
-    # STAGE 3: Merge and sort results
-    # Sort exact matches by published date (newest first)
-    exact_list = sorted(
+    # STAGE 3: Merge and sort results - only the top entries are kept, so select them with a heap
+    # Exact matches by published date (newest first)
+    exact_list = heapq.nlargest(
+        limit,
         exact_episodes.values(),
         key=lambda x: (
             x["episode"].published_at if x["episode"].published_at else x["episode"].created_at
         )
         or x["episode"].created_at,
-        reverse=True,
     )
 
-    # Sort semantic matches by similarity score (best first), then by date (newest first)
-    semantic_list = sorted(
-        semantic_episodes.values(),
-        key=lambda x: (
-            x["similarity_score"],  # Lower cosine distance = better match
-            -(
-                x["episode"].published_at.timestamp()
-                if x["episode"].published_at
-                else x["episode"].created_at.timestamp()
-            ),
-        ),
-    )
+    # Semantic matches fill the remaining slots - already in similarity order (best first) from the query
+    remaining_slots = max(limit - len(exact_list), 0)
+    semantic_list = list(semantic_episodes.values())[:remaining_slots]
 
     response = []
 
@@ -489,9 +551,7 @@ async def hybrid_search_episodes(
                 "podcast_title": e.podcast.title if e.podcast else None,
                 "podcast_author": e.podcast.author if e.podcast else None,
                 "summary": {"id": str(e.summary.id), "text": e.summary.text} if e.summary else None,
-                "transcription": {"id": str(e.transcription.id), "text": e.transcription.text}
-                if e.transcription
-                else None,
+                "transcription": {"id": str(e.transcription.id)} if e.transcription else None,
                 "processed_at": e.summary.created_at.isoformat() if e.summary else None,
                 "match_snippet": episode_data["snippet"],
                 "exact_match": True,
@@ -499,8 +559,7 @@ async def hybrid_search_episodes(
         )
 
     # Add sorted semantic matches (up to limit)
-    remaining_slots = limit - len(response)
-    for episode_data in semantic_list[:remaining_slots]:
+    for episode_data in semantic_list:
         e = episode_data["episode"]
         response.append(
             {
@@ -516,9 +575,7 @@ async def hybrid_search_episodes(
                 "podcast_title": e.podcast.title if e.podcast else None,
                 "podcast_author": e.podcast.author if e.podcast else None,
                 "summary": {"id": str(e.summary.id), "text": e.summary.text} if e.summary else None,
-                "transcription": {"id": str(e.transcription.id), "text": e.transcription.text}
-                if e.transcription
-                else None,
+                "transcription": {"id": str(e.transcription.id)} if e.transcription else None,
                 "processed_at": e.summary.created_at.isoformat() if e.summary else None,
                 "match_snippet": episode_data["snippet"],
                 "exact_match": False,
@@ -537,19 +594,16 @@ async def list_processed_podcasts(
     db: AsyncSession = Depends(get_db)
 ):
     """Get podcasts that have at least one processed episode (with summary)"""
-    from sqlalchemy import or_
+    from sqlalchemy import desc, or_
 
-    # Get podcasts with at least one episode that has a summary
-    query = (
-        select(Podcast)
-        .join(Episode, Episode.podcast_id == Podcast.id)
+    # Only podcasts with a processed episode - EXISTS lets Postgres stop at the first summary found
+    has_processed = (
+        select(Episode.id)
         .join(Summary, Summary.episode_id == Episode.id)
-        .options(
-            selectinload(Podcast.episodes).selectinload(Episode.transcription),
-            selectinload(Podcast.episodes).selectinload(Episode.summary),
-        )
-        .distinct()
+        .where(Episode.podcast_id == Podcast.id)
+        .exists()
     )
+    query = select(*PODCAST_LIST_COLUMNS).where(has_processed)
 
     # Filter by user
     query = apply_user_filter(query, current_user)
@@ -565,29 +619,29 @@ async def list_processed_podcasts(
             )
         )
 
-    result = await db.execute(query)
-    podcasts = list(result.scalars().all())
-
-    # Ensure all relationships are loaded
-    for podcast in podcasts:
-        _ = podcast.episodes
-
     # Sort by most recently processed episode (default) or other options
     sort_by = sort or "processed_desc"
     if sort_by == "processed_desc":
-        # Sort by most recently created summary
-        podcasts.sort(
-            key=lambda p: max((e.summary.created_at for e in p.episodes if e.summary), default=""),
-            reverse=True,
+        # Most recent summary per podcast, correlated to each matching row
+        last_processed = (
+            select(func.max(Summary.created_at))
+            .join(Episode, Episode.id == Summary.episode_id)
+            .where(Episode.podcast_id == Podcast.id)
+            .scalar_subquery()
         )
+        query = query.order_by(desc(last_processed).nulls_last())
     elif sort_by == "name_asc":
-        podcasts.sort(key=lambda p: p.title.lower())
+        query = query.order_by(func.lower(Podcast.title))
     elif sort_by == "name_desc":
-        podcasts.sort(key=lambda p: p.title.lower(), reverse=True)
+        query = query.order_by(desc(func.lower(Podcast.title)))
     elif sort_by == "episodes_desc":
-        podcasts.sort(key=lambda p: len(p.episodes), reverse=True)
+        # episode_count is kept current by update_podcast_counts - no COUNT over episodes needed
+        query = query.order_by(desc(Podcast.episode_count))
 
-    return podcasts
+    result = await db.execute(query)
+
+    # Convert to response format without loading episodes (same as list_podcasts)
+    return [PodcastResponse.model_construct(**row, episodes=[]) for row in result.mappings()]
 
 
 @router.post("/refresh-all")
@@ -605,38 +659,50 @@ async def refresh_all_podcasts(
     result = await db.execute(query)
     podcasts = result.scalars().all()
 
+    async def _fetch_feed(podcast: Podcast) -> tuple[dict, list[dict]]:
+        # Blocking HTTP fetch + parse runs in worker threads so feeds download concurrently
+        feed_data = await asyncio.to_thread(rss_parser.parse_podcast_feed, podcast.rss_url)
+        episodes_data = await asyncio.to_thread(rss_parser.parse_episodes, podcast.rss_url)
+        return feed_data, episodes_data
+
+    results = await asyncio.gather(*(_fetch_feed(p) for p in podcasts), return_exceptions=True)
+
     updated_count = 0
     failed_count = 0
-    for podcast in podcasts:
-        try:
-            # Update podcast metadata (title, author, category, etc.)
-            feed_data = rss_parser.parse_podcast_feed(podcast.rss_url)
-            podcast.title = feed_data.get("title", podcast.title)
-            podcast.description = feed_data.get("description", podcast.description)
-            podcast.author = feed_data.get("author", podcast.author)
-
-            # Only update image_url if it's not a custom uploaded image
-            # Custom images are stored as /echolens_data/uploads/{podcast_slug}/cover.{ext}
-            is_custom_image = (
-                podcast.image_url
-                and podcast.image_url.startswith("/echolens_data/uploads/")
-                and "cover." in podcast.image_url
-            )
-            if not is_custom_image:
-                podcast.image_url = feed_data.get("image_url", podcast.image_url)
+    metadata_updates = []
+    refreshed = []
+    for podcast, fetched in zip(podcasts, results, strict=True):
+        if isinstance(fetched, Exception):
+            logger.error("podcast_refresh_failed", podcast_id=str(podcast.id), podcast_title=podcast.title, user_id=str(current_user.id), error=str(fetched))
+            failed_count += 1
+            continue
+        if isinstance(fetched, BaseException):
+            raise fetched
 
-            podcast.category = feed_data.get("category", podcast.category)
+        feed_data, episodes_data = fetched
+        metadata_updates.append({"id": podcast.id, **_feed_metadata_values(podcast, feed_data)})
+        # Plain values - a rollback below expires the ORM instances
+        refreshed.append((podcast.id, podcast.rss_url, podcast.title, episodes_data))
 
-            # Update episodes
-            await fetch_episodes(podcast.id, podcast.rss_url, db)
+    # Update podcast metadata (title, author, category, etc.) with one bulk UPDATE by primary key
+    if metadata_updates:
+        await db.execute(update(Podcast), metadata_updates)
+        await db.commit()
+
+    # Store episodes one podcast at a time - the session can't be shared across tasks
+    for podcast_id, rss_url, podcast_title, episodes_data in refreshed:
+        try:
+            await fetch_episodes(podcast_id, rss_url, db, episodes_data=episodes_data)
+            await db.commit()
             updated_count += 1
         except Exception as e:
-            logger.error("podcast_refresh_failed", podcast_id=str(podcast.id), podcast_title=podcast.title, user_id=str(current_user.id), error=str(e))
+            await db.rollback()
+            logger.error("podcast_refresh_failed", podcast_id=str(podcast_id), podcast_title=podcast_title, user_id=str(current_user.id), error=str(e))
             failed_count += 1
-            continue
 
     # Commit all updates
     await db.commit()
+    _invalidate_categories(current_user.id)
 
     # Create notification
     notification = Notification(
@@ -668,26 +734,14 @@ async def refresh_podcast(
 
     try:
         # Update podcast metadata (title, author, category, etc.)
-        feed_data = rss_parser.parse_podcast_feed(podcast.rss_url)
-        podcast.title = feed_data.get("title", podcast.title)
-        podcast.description = feed_data.get("description", podcast.description)
-        podcast.author = feed_data.get("author", podcast.author)
-
-        # Only update image_url if it's not a custom uploaded image
-        # Custom images are stored as /echolens_data/uploads/{podcast_slug}/cover.{ext}
-        is_custom_image = (
-            podcast.image_url
-            and podcast.image_url.startswith("/echolens_data/uploads/")
-            and "cover." in podcast.image_url
-        )
-        if not is_custom_image:
-            podcast.image_url = feed_data.get("image_url", podcast.image_url)
-
-        podcast.category = feed_data.get("category", podcast.category)
+        feed_data = await asyncio.to_thread(rss_parser.parse_podcast_feed, podcast.rss_url)
+        for key, value in _feed_metadata_values(podcast, feed_data).items():
+            setattr(podcast, key, value)
 
         # Update episodes
         await fetch_episodes(podcast.id, podcast.rss_url, db)
         await db.commit()
+        _invalidate_categories(current_user.id)
 
         # Create notification
         notification = Notification(
@@ -715,21 +769,34 @@ async def get_podcast(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    # Verify ownership
-    podcast = await verify_podcast_ownership(podcast_id, current_user, db)
-
-    # Reload with relationships
-    result = await db.execute(
-        select(Podcast)
-        .options(
+    # Verify ownership, loading episodes in the same query
+    return await verify_podcast_ownership(
+        podcast_id,
+        current_user,
+        db,
+        options=(
             selectinload(Podcast.episodes).selectinload(Episode.transcription),
             selectinload(Podcast.episodes).selectinload(Episode.summary),
-        )
-        .where(Podcast.id == podcast_id)
+        ),
     )
-    podcast = result.scalar_one()
 
-    return podcast
+
+def _dir_size(path: str) -> int:
+    """Total size in bytes of the files under path (0 if it doesn't exist)"""
+    total = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                    elif entry.is_dir(follow_symlinks=False):
+                        total += _dir_size(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return total
 
 
 @router.get("/{podcast_id}/storage")
@@ -739,8 +806,6 @@ async def get_podcast_storage(
     db: AsyncSession = Depends(get_db)
 ):
     """Get estimated storage usage for a podcast (audio files, transcriptions, embeddings)"""
-    import os
-
     # Verify ownership and get podcast
     podcast = await verify_podcast_ownership(podcast_id, current_user, db)
 
@@ -748,17 +813,8 @@ async def get_podcast_storage(
     storage_path = get_user_storage_path(podcast.user_id, podcast.title)
     podcast_dir = Path(storage_path)
 
-    total_bytes = 0
-
-    # Calculate directory size if it exists
-    if podcast_dir.exists():
-        for dirpath, dirnames, filenames in os.walk(podcast_dir):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                try:
-                    total_bytes += os.path.getsize(filepath)
-                except (OSError, FileNotFoundError):
-                    pass
+    # Calculate directory size (off the event loop - one stat per file)
+    total_bytes = await asyncio.to_thread(_dir_size, str(podcast_dir))
 
     # Format bytes to human-readable format
     def format_bytes(bytes_size):
@@ -792,10 +848,10 @@ async def delete_podcast(
     storage_path = get_user_storage_path(podcast.user_id, podcast.title)
     podcast_dir = Path(storage_path)
 
-    # Delete filesystem files (audio files, custom images)
+    # Delete filesystem files (audio files, custom images) without blocking the event loop
     if podcast_dir.exists():
         try:
-            shutil.rmtree(podcast_dir)
+            await asyncio.to_thread(shutil.rmtree, podcast_dir)
         except Exception as e:
             # Log error but continue with database deletion
             logger.warning("podcast_directory_delete_failed", podcast_id=str(podcast_id), podcast_dir=str(podcast_dir), user_id=str(current_user.id), error=str(e))
@@ -813,6 +869,9 @@ async def delete_podcast(
     # - Notifications (via ForeignKey ondelete="CASCADE")
     await db.execute(sql_delete(Podcast).where(Podcast.id == podcast_id))
     await db.commit()
+    # The podcast's owner's caches, which aren't necessarily the caller's
+    _invalidate_categories(podcast.user_id)
+    invalidate_user_podcast_ids(podcast.user_id)
 
     return {"status": "success", "message": f"Podcast '{podcast.title}' deleted successfully"}
 
@@ -849,7 +908,7 @@ async def list_episodes(
     db: AsyncSession = Depends(get_db),
 ):
     # Verify ownership
-    await verify_podcast_ownership(podcast_id, current_user, db)
+    await check_podcast_ownership(podcast_id, current_user, db)
 
     query = (
         select(Episode)
@@ -861,16 +920,25 @@ async def list_episodes(
         .where(Episode.podcast_id == podcast_id)
     )
 
-    # Apply search filter
+    # Apply search filter - full-text (GIN-indexed search_tsv) for words, ILIKE only for
+    # explicit wildcard patterns (served by the trigram indexes)
     if search:
-        search_term = f"%{search}%"
-        query = query.where(
-            Episode.title.ilike(search_term) | Episode.description.ilike(search_term)
-        )
+        if "%" in search or "_" in search or "*" in search:
+            search_term = search.replace("*", "%")
+            query = query.where(
+                Episode.title.ilike(search_term) | Episode.description.ilike(search_term)
+            )
+        else:
+            query = query.where(
+                Episode.search_tsv.op("@@")(func.plainto_tsquery("english", search))
+            )
 
     # Filter by processed episodes
     if processed_only:
-        query = query.where(Episode.transcription.has())
+        # Correlated EXISTS on transcriptions.episode_id (indexed by its unique constraint)
+        query = query.where(
+            select(Transcription.id).where(Transcription.episode_id == Episode.id).exists()
+        )
 
     # Order by published date descending
     query = query.order_by(Episode.published_at.desc())
@@ -885,20 +953,14 @@ async def get_episode(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    # Verify ownership
-    episode = await verify_episode_ownership(episode_id, current_user, db)
-
-    # Reload with relationships
-    result = await db.execute(
-        select(Episode)
-        .options(
-            selectinload(Episode.transcription),
-            selectinload(Episode.summary),
-            selectinload(Episode.podcast),
-        )
-        .where(Episode.id == episode_id)
+    # Verify ownership, loading relationships in the same call
+    episode = await verify_episode_ownership(
+        episode_id,
+        current_user,
+        db,
+        load_podcast=True,
+        options=(selectinload(Episode.transcription), selectinload(Episode.summary)),
     )
-    episode = result.scalar_one()
 
     # Convert to dict and add podcast image_url and podcast info
     episode_dict = {
@@ -937,16 +999,10 @@ async def stream_episode_audio(
     import httpx
     from fastapi.responses import StreamingResponse
 
-    # Verify ownership
-    await verify_podcast_ownership(podcast_id, current_user, db)
-
-    # Get episode
-    result = await db.execute(
-        select(Episode).where(Episode.id == episode_id, Episode.podcast_id == podcast_id)
-    )
-    episode = result.scalar_one_or_none()
+    # Verify ownership - one query, the podcast is only joined for the owner filter
+    episode = await verify_episode_ownership(episode_id, current_user, db)
 
-    if not episode:
+    if episode.podcast_id != podcast_id:
         raise HTTPException(status_code=404, detail="Episode not found")
 
     if not episode.audio_url:
@@ -1017,17 +1073,9 @@ async def download_episode_audio(
     from app.core.config import settings
     from app.services import audio_downloader
 
-    # Verify ownership
-    await verify_podcast_ownership(podcast_id, current_user, db)
-
-    result = await db.execute(
-        select(Episode)
-        .options(selectinload(Episode.podcast))
-        .where(Episode.id == episode_id, Episode.podcast_id == podcast_id)
-    )
-    episode = result.scalar_one_or_none()
-
-    if not episode:
+    # Verify ownership and load the episode with its podcast in one query
+    episode = await verify_episode_ownership(episode_id, current_user, db, load_podcast=True)
+    if episode.podcast_id != podcast_id:
         return JSONResponse(content={"error": "Episode not found"}, status_code=404)
 
     # Check if already downloaded
@@ -1073,10 +1121,20 @@ async def download_episode_audio(
         return JSONResponse(content={"error": "Failed to download audio"}, status_code=500)
 
 
+def _delete_local_files(paths: list[str], episode_id: UUID):
+    """Remove an episode's local audio files (runs as a background task in the threadpool)"""
+    for path in paths:
+        try:
+            Path(path).unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning("local_file_delete_failed", episode_id=str(episode_id), path=path, error=str(e))
+
+
 @router.delete("/{podcast_id}/episodes/{episode_id}/local-data")
 async def delete_episode_local_data(
     podcast_id: UUID,
     episode_id: UUID,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -1087,46 +1145,35 @@ async def delete_episode_local_data(
 
     from app.models.podcast import Summary, Term, Transcription, VectorSlice
 
-    # Verify ownership
-    await verify_podcast_ownership(podcast_id, current_user, db)
-
-    result = await db.execute(
-        select(Episode)
-        .options(selectinload(Episode.podcast))
-        .where(Episode.id == episode_id, Episode.podcast_id == podcast_id)
+    # Verify ownership and load the episode with its podcast and summary
+    episode = await verify_episode_ownership(
+        episode_id, current_user, db, options=(selectinload(Episode.summary),)
     )
-    episode = result.scalar_one_or_none()
-
-    if not episode:
+    if episode.podcast_id != podcast_id:
         return JSONResponse(content={"error": "Episode not found"}, status_code=404)
 
     try:
-        # Delete audio file if exists
+        # Audio files (episode + summary) are removed after the response, on a worker thread
+        files_to_delete = []
         if episode.local_audio_path:
-            audio_file = Path(episode.local_audio_path)
-            if audio_file.exists():
-                try:
-                    audio_file.unlink()
-                except Exception as e:
-                    logger.warning("audio_file_delete_failed", episode_id=str(episode_id), audio_file=str(audio_file), user_id=str(current_user.id), error=str(e))
+            files_to_delete.append(episode.local_audio_path)
             episode.local_audio_path = None
 
-        # Delete summary audio file if exists
-        summary_result = await db.execute(select(Summary).where(Summary.episode_id == episode_id))
-        summary = summary_result.scalar_one_or_none()
+        summary = episode.summary
         if summary and summary.audio_path:
-            summary_audio = Path(summary.audio_path)
-            if summary_audio.exists():
-                try:
-                    summary_audio.unlink()
-                except Exception as e:
-                    logger.warning("summary_audio_delete_failed", episode_id=str(episode_id), summary_audio=str(summary_audio), user_id=str(current_user.id), error=str(e))
-
-        # Delete database records
-        await db.execute(sql_delete(Transcription).where(Transcription.episode_id == episode_id))
-        await db.execute(sql_delete(Summary).where(Summary.episode_id == episode_id))
-        await db.execute(sql_delete(Term).where(Term.episode_id == episode_id))
-        await db.execute(sql_delete(VectorSlice).where(VectorSlice.episode_id == episode_id))
+            files_to_delete.append(summary.audio_path)
+
+        # Delete database records in one statement - the other tables ride along as data-modifying CTEs
+        await db.execute(
+            sql_delete(VectorSlice)
+            .where(VectorSlice.episode_id == episode_id)
+            .add_cte(
+                sql_delete(Transcription).where(Transcription.episode_id == episode_id).cte("deleted_transcriptions"),
+                sql_delete(Summary).where(Summary.episode_id == episode_id).cte("deleted_summaries"),
+                sql_delete(Term).where(Term.episode_id == episode_id).cte("deleted_terms"),
+            )
+            .execution_options(synchronize_session=False)
+        )
 
         await db.commit()
 
@@ -1146,6 +1193,9 @@ async def delete_episode_local_data(
         db.add(notification)
         await db.commit()
 
+        if files_to_delete:
+            background_tasks.add_task(_delete_local_files, files_to_delete, episode_id)
+
         return JSONResponse(content={"message": "Local data deleted successfully"})
     except Exception as e:
         logger.exception("local_data_delete_failed", episode_id=str(episode_id), podcast_id=str(podcast_id), user_id=str(current_user.id), error=str(e))
@@ -1163,7 +1213,7 @@ async def bulk_process_episodes(
     from app.models.podcast import TaskHistory
 
     # Verify ownership
-    await verify_podcast_ownership(podcast_id, current_user, db)
+    await check_podcast_ownership(podcast_id, current_user, db)
 
     # Get episode IDs from form data
     form = await request.form()
@@ -1174,50 +1224,53 @@ async def bulk_process_episodes(
             content='<div class="text-red-500">No episodes selected</div>', status_code=400
         )
 
-    # Parse episode IDs
-    episode_ids = [UUID(id.strip()) for id in episode_ids_str.split(",") if id.strip()]
+    # Parse episode IDs (dropping repeats so the count check below stays exact)
+    episode_ids = list(dict.fromkeys(UUID(id.strip()) for id in episode_ids_str.split(",") if id.strip()))
 
     if not episode_ids:
         return HTMLResponse(
             content='<div class="text-red-500">No valid episodes selected</div>', status_code=400
         )
 
-    # Verify all episodes exist and belong to this podcast
+    # Verify all episodes exist and belong to this podcast by count alone - one row back,
+    # with the podcast title for the notification
     result = await db.execute(
-        select(Episode).where(Episode.id.in_(episode_ids), Episode.podcast_id == podcast_id)
+        select(Podcast.title, func.count(Episode.id))
+        .join(Episode, Episode.podcast_id == Podcast.id)
+        .where(Podcast.id == podcast_id, Episode.id.in_(episode_ids))
+        .group_by(Podcast.id)
     )
-    episodes = result.scalars().all()
+    row = result.one_or_none()
 
-    if len(episodes) != len(episode_ids):
+    if row is None or row[1] != len(episode_ids):
         return HTMLResponse(
             content='<div class="text-red-500">Some episodes not found</div>', status_code=404
         )
 
-    # Queue all episodes for processing
-    queued_count = 0
-    for episode in episodes:
-        task = process_episode_task.delay(str(episode.id))
+    podcast_title = row[0]
 
-        # Create task history entry
-        task_history = TaskHistory(
-            task_id=task.id, episode_id=episode.id, podcast_id=podcast_id, status="PENDING"
-        )
-        db.add(task_history)
-        queued_count += 1
+    # Queue all episodes for processing as one group (publishing is blocking I/O - keep it off the event loop)
+    group_result = await asyncio.to_thread(
+        group(process_episode_task.s(str(episode_id)) for episode_id in episode_ids).apply_async
+    )
 
-    await db.commit()
+    # Create task history entries with one bulk insert
+    await db.execute(
+        insert(TaskHistory),
+        [
+            {"task_id": task.id, "episode_id": episode_id, "podcast_id": podcast_id, "status": "PENDING"}
+            for task, episode_id in zip(group_result.results, episode_ids, strict=True)
+        ],
+    )
+    queued_count = len(episode_ids)
 
     # Create notification
     from app.models.podcast import Notification
 
-    # Get podcast for notification
-    podcast_result = await db.execute(select(Podcast).where(Podcast.id == podcast_id))
-    podcast = podcast_result.scalar_one()
-
     notification = Notification(
         type="bulk_processing_started",
         title="Bulk Processing Started",
-        message=f"Queued {queued_count} episode{'s' if queued_count != 1 else ''} from '{podcast.title}' for AI processing",
+        message=f"Queued {queued_count} episode{'s' if queued_count != 1 else ''} from '{podcast_title}' for AI processing",
         level="info",
         podcast_id=podcast_id,
         user_id=current_user.id,
@@ -1270,12 +1323,77 @@ async def extract_more_terms(
     return JSONResponse({"task_id": task.id, "status": "started"})
 
 
+# Rendered term cards kept in-process; the key is the rendered content itself, so edits miss naturally
+TERM_CARD_CACHE_SIZE = 4096
+
+
+def _term_card_html(term: Term) -> str:
+    """Term card (with kebab menu) as rendered in the episode's terms list"""
+    return _render_term_card(
+        term.id, term.term, term.context, term.explanation, bool(term.elaborate_explanation)
+    )
+
+
+@lru_cache(maxsize=TERM_CARD_CACHE_SIZE)
+def _render_term_card(
+    term_id: UUID, term: str, context: str | None, explanation: str | None, has_elaborate: bool
+) -> str:
+    context_html = (
+        f'<p class="text-xs text-gray-500 dark:text-gray-400 italic mb-2 border-l-2 border-gray-300 dark:border-gray-600 pl-2">"{context}"</p>'
+        if context
+        else ""
+    )
+    explanation_html = (
+        f'<p class="text-sm text-gray-700 dark:text-gray-300" id="explanation-{term_id}">{explanation}</p>'
+        if explanation
+        else '<p class="text-sm text-gray-500 dark:text-gray-400 italic">No explanation available</p>'
+    )
+    elaborate_btn = (
+        f'<button hx-get="/api/terms/{term_id}/elaborate-modal" hx-target="#modal-container" hx-swap="innerHTML" class="mt-2 text-xs text-blue-600 dark:text-blue-400 hover:underline">View detailed explanation</button>'
+        if has_elaborate
+        else ""
+    )
+
+    return f"""
+    <div class="bg-white dark:bg-gray-800 border border-light-border dark:border-dark-border rounded-lg p-4 shadow-sm hover:shadow-md transition-shadow relative" data-term-id="{term_id}">
+        <div class="flex items-start justify-between mb-2">
+            <h5 class="font-semibold text-lg text-blue-600 dark:text-blue-400 flex-1">{term}</h5>
+            <div class="relative">
+                <button onclick="toggleTermMenu('{term_id}')" class="p-1 hover:bg-gray-100 dark:hover:bg-gray-700 rounded">
+                    <svg class="w-5 h-5 text-gray-600 dark:text-gray-400" fill="currentColor" viewBox="0 0 16 16">
+                        <circle cx="8" cy="3" r="1.5"/>
+                        <circle cx="8" cy="8" r="1.5"/>
+                        <circle cx="8" cy="13" r="1.5"/>
+                    </svg>
+                </button>
+                <div id="menu-{term_id}" class="hidden absolute right-0 mt-1 w-48 bg-white dark:bg-gray-800 border border-light-border dark:border-dark-border rounded-lg shadow-lg z-10">
+                    <button hx-post="/api/terms/{term_id}/hide" hx-swap="outerHTML" hx-target="[data-term-id='{term_id}']" hx-on::after-request="if(event.detail.successful) {{ showToast('Term hidden', 'success'); }}" class="w-full text-left px-4 py-2 text-sm hover:bg-gray-100 dark:hover:bg-gray-700 flex items-center gap-2">
+                        <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M13.875 18.825A10.05 10.05 0 0112 19c-4.478 0-8.268-2.943-9.543-7a9.97 9.97 0 011.563-3.029m5.858.908a3 3 0 114.243 4.243M9.878 9.878l4.242 4.242M9.88 9.88l-3.29-3.29m7.532 7.532l3.29 3.29M3 3l3.59 3.59m0 0A9.953 9.953 0 0112 5c4.478 0 8.268 2.943 9.543 7a10.025 10.025 0 01-4.132 5.411m0 0L21 21"></path></svg>
+                        Hide
+                    </button>
+                    <button hx-post="/api/terms/{term_id}/elaborate" hx-swap="none" hx-indicator="#elaborate-spinner-{term_id}" hx-on::before-request="document.getElementById('menu-{term_id}').classList.add('hidden');" hx-on::after-request="if(event.detail.successful) {{ showToast('Elaborate explanation generated', 'success'); location.reload(); }}" class="w-full text-left px-4 py-2 text-sm hover:bg-gray-100 dark:hover:bg-gray-700 border-t border-light-border dark:border-dark-border flex items-center gap-2">
+                        <svg id="elaborate-spinner-{term_id}" class="htmx-indicator w-4 h-4 animate-spin" fill="none" stroke="currentColor" viewBox="0 0 24 24"><circle class="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" stroke-width="4"></circle><path class="opacity-75" fill="currentColor" d="M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z"></path></svg>
+                        <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M9 12h6m-6 4h6m2 5H7a2 2 0 01-2-2V5a2 2 0 012-2h5.586a1 1 0 01.707.293l5.414 5.414a1 1 0 01.293.707V19a2 2 0 01-2 2z"></path></svg>
+                        Elaborate
+                    </button>
+                </div>
+            </div>
+        </div>
+        {context_html}
+        {explanation_html}
+        {elaborate_btn}
+    </div>
+    """
+
+
 @router.get("/episodes/{episode_id}/extract-terms-progress/{task_id}")
 async def get_extraction_progress(
     episode_id: UUID,
     task_id: str,
+    request: Request,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ):
     """
     Poll progress of term extraction task.
@@ -1287,146 +1405,108 @@ async def get_extraction_progress(
     from fastapi.responses import JSONResponse
 
     # Verify ownership
-    await verify_episode_ownership(episode_id, current_user, db)
+    await check_episode_ownership(episode_id, current_user, db)
 
-    # Get task status
+    # Get task status (state and info each hit the result backend - read them once)
     task = AsyncResult(task_id)
-
-    # Get current terms for this episode (excluding hidden)
-    all_terms_result = await db.execute(
-        select(Term).where(Term.episode_id == episode_id, Term.hidden == 0)
+    state = task.state
+    info = task.info
+
+    # Fingerprint of the visible terms - changes whenever one is added, hidden/unhidden or elaborated,
+    # so the rendered HTML can be cached under it without explicit invalidation
+    visible_terms = (Term.episode_id == episode_id, Term.hidden == 0)
+    fingerprint_result = await db.execute(
+        select(
+            func.count(Term.id),
+            func.max(Term.created_at),
+            func.count(Term.elaborate_explanation),
+            func.coalesce(func.sum(func.hashtext(cast(Term.id, String))), 0),
+        ).where(*visible_terms)
     )
-    all_terms = all_terms_result.scalars().all()
-
-    # Build terms HTML with kebab menu
-    terms_html = ""
-    for term in all_terms:
-        context_html = (
-            f'<p class="text-xs text-gray-500 dark:text-gray-400 italic mb-2 border-l-2 border-gray-300 dark:border-gray-600 pl-2">"{term.context}"</p>'
-            if term.context
-            else ""
-        )
-        explanation_html = (
-            f'<p class="text-sm text-gray-700 dark:text-gray-300" id="explanation-{term.id}">{term.explanation}</p>'
-            if term.explanation
-            else '<p class="text-sm text-gray-500 dark:text-gray-400 italic">No explanation available</p>'
-        )
-        elaborate_btn = (
-            f'<button hx-get="/api/terms/{term.id}/elaborate-modal" hx-target="#modal-container" hx-swap="innerHTML" class="mt-2 text-xs text-blue-600 dark:text-blue-400 hover:underline">View detailed explanation</button>'
-            if term.elaborate_explanation
-            else ""
-        )
-
-        terms_html += f"""
-        <div class="bg-white dark:bg-gray-800 border border-light-border dark:border-dark-border rounded-lg p-4 shadow-sm hover:shadow-md transition-shadow relative" data-term-id="{term.id}">
-            <div class="flex items-start justify-between mb-2">
-                <h5 class="font-semibold text-lg text-blue-600 dark:text-blue-400 flex-1">{term.term}</h5>
-                <div class="relative">
-                    <button onclick="toggleTermMenu('{term.id}')" class="p-1 hover:bg-gray-100 dark:hover:bg-gray-700 rounded">
-                        <svg class="w-5 h-5 text-gray-600 dark:text-gray-400" fill="currentColor" viewBox="0 0 16 16">
-                            <circle cx="8" cy="3" r="1.5"/>
-                            <circle cx="8" cy="8" r="1.5"/>
-                            <circle cx="8" cy="13" r="1.5"/>
-                        </svg>
-                    </button>
-                    <div id="menu-{term.id}" class="hidden absolute right-0 mt-1 w-48 bg-white dark:bg-gray-800 border border-light-border dark:border-dark-border rounded-lg shadow-lg z-10">
-                        <button hx-post="/api/terms/{term.id}/hide" hx-swap="outerHTML" hx-target="[data-term-id='{term.id}']" hx-on::after-request="if(event.detail.successful) {{ showToast('Term hidden', 'success'); }}" class="w-full text-left px-4 py-2 text-sm hover:bg-gray-100 dark:hover:bg-gray-700 flex items-center gap-2">
-                            <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M13.875 18.825A10.05 10.05 0 0112 19c-4.478 0-8.268-2.943-9.543-7a9.97 9.97 0 011.563-3.029m5.858.908a3 3 0 114.243 4.243M9.878 9.878l4.242 4.242M9.88 9.88l-3.29-3.29m7.532 7.532l3.29 3.29M3 3l3.59 3.59m0 0A9.953 9.953 0 0112 5c4.478 0 8.268 2.943 9.543 7a10.025 10.025 0 01-4.132 5.411m0 0L21 21"></path></svg>
-                            Hide
-                        </button>
-                        <button hx-post="/api/terms/{term.id}/elaborate" hx-swap="none" hx-indicator="#elaborate-spinner-{term.id}" hx-on::before-request="document.getElementById('menu-{term.id}').classList.add('hidden');" hx-on::after-request="if(event.detail.successful) {{ showToast('Elaborate explanation generated', 'success'); location.reload(); }}" class="w-full text-left px-4 py-2 text-sm hover:bg-gray-100 dark:hover:bg-gray-700 border-t border-light-border dark:border-dark-border flex items-center gap-2">
-                            <svg id="elaborate-spinner-{term.id}" class="htmx-indicator w-4 h-4 animate-spin" fill="none" stroke="currentColor" viewBox="0 0 24 24"><circle class="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" stroke-width="4"></circle><path class="opacity-75" fill="currentColor" d="M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z"></path></svg>
-                            <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M9 12h6m-6 4h6m2 5H7a2 2 0 01-2-2V5a2 2 0 012-2h5.586a1 1 0 01.707.293l5.414 5.414a1 1 0 01.293.707V19a2 2 0 01-2 2z"></path></svg>
-                            Elaborate
-                        </button>
-                    </div>
-                </div>
-            </div>
-            {context_html}
-            {explanation_html}
-            {elaborate_btn}
-        </div>
-        """
+    fingerprint = fingerprint_result.one()
+    total_terms = fingerprint[0]
+    cache_key = f"terms_html:{episode_id}:" + ":".join(str(value) for value in fingerprint)
 
     # Build response based on task state
-    if task.state == "PENDING":
-        return JSONResponse(
-            {
-                "status": "pending",
-                "progress_percent": 0,
-                "total_terms": len(all_terms),
-                "terms_html": terms_html,
-            }
-        )
-    if task.state == "STARTED":
+    status_code = 200
+    if state == "PENDING":
+        payload = {
+            "status": "pending",
+            "progress_percent": 0,
+            "total_terms": total_terms,
+        }
+    elif state == "STARTED":
         # Task just started but hasn't set progress yet
-        return JSONResponse(
-            {
-                "status": "processing",
-                "progress_percent": 0,
-                "chunk_num": 0,
-                "total_chunks": 0,
-                "total_terms": len(all_terms),
-                "terms_html": terms_html,
-            }
-        )
-    if task.state == "PROGRESS":
-        meta = task.info or {}
+        payload = {
+            "status": "processing",
+            "progress_percent": 0,
+            "chunk_num": 0,
+            "total_chunks": 0,
+            "total_terms": total_terms,
+        }
+    elif state == "PROGRESS":
+        meta = info or {}
         # Handle case where task.info is not a dict (e.g., initial state)
         if not isinstance(meta, dict):
-            return JSONResponse(
-                {
-                    "status": "processing",
-                    "progress_percent": 0,
-                    "chunk_num": 0,
-                    "total_chunks": 0,
-                    "total_terms": len(all_terms),
-                    "terms_html": terms_html,
-                }
-            )
-        return JSONResponse(
-            {
-                "status": "processing",
-                "progress_percent": meta.get("progress_percent", 0),
-                "chunk_num": meta.get("chunk_num", 0),
-                "total_chunks": meta.get("total_chunks", 0),
-                "total_terms": len(all_terms),
-                "terms_html": terms_html,
-            }
-        )
-    if task.state == "SUCCESS":
-        result = task.info or {}
+            meta = {}
+        payload = {
+            "status": "processing",
+            "progress_percent": meta.get("progress_percent", 0),
+            "chunk_num": meta.get("chunk_num", 0),
+            "total_chunks": meta.get("total_chunks", 0),
+            "total_terms": total_terms,
+        }
+    elif state == "SUCCESS":
+        result = info or {}
         if not isinstance(result, dict):
             result = {}
-        return JSONResponse(
-            {
-                "status": "complete",
-                "progress_percent": 100,
-                "total_terms": len(all_terms),
-                "added_this_run": result.get("added_this_run", 0),
-                "terms_html": terms_html,
-            }
-        )
-    if task.state == "FAILURE":
+        payload = {
+            "status": "complete",
+            "progress_percent": 100,
+            "total_terms": total_terms,
+            "added_this_run": result.get("added_this_run", 0),
+        }
+    elif state == "FAILURE":
         # Get the actual error from the result
         error_msg = "Extraction failed"
         try:
-            if hasattr(task.info, "__str__"):
-                error_msg = str(task.info)
+            if hasattr(info, "__str__"):
+                error_msg = str(info)
         except:
             pass
-        return JSONResponse(
-            {"status": "error", "error": error_msg, "terms_html": terms_html}, status_code=500
-        )
-    # Unknown state - return as processing
-    return JSONResponse(
-        {
+        payload = {"status": "error", "error": error_msg}
+        status_code = 500
+    else:
+        # Unknown state - return as processing
+        payload = {
             "status": "processing",
             "progress_percent": 0,
-            "total_terms": len(all_terms),
-            "terms_html": terms_html,
+            "total_terms": total_terms,
         }
-    )
+
+    # Progress fields + terms fingerprint identify the response, so an unchanged poll
+    # (typically after the task finished) gets a 304 without touching Redis or rendering
+    etag_source = f"{cache_key}|{sorted(payload.items())}"
+    etag = f'"{hashlib.blake2b(etag_source.encode(), digest_size=8).hexdigest()}"'
+    cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if status_code == 200 and request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=cache_headers)
+
+    cached_html = await redis.get(cache_key)
+    if cached_html is not None:
+        terms_html = cached_html.decode()
+    else:
+        # Get current terms for this episode (excluding hidden)
+        all_terms_result = await db.execute(select(Term).where(*visible_terms))
+        all_terms = all_terms_result.scalars().all()
+
+        # Build terms HTML with kebab menu - joined once rather than concatenated per term
+        terms_html = "".join(_term_card_html(term) for term in all_terms)
+        await redis.setex(cache_key, TERMS_HTML_CACHE_TTL, terms_html)
+
+    payload["terms_html"] = terms_html
+    return JSONResponse(payload, status_code=status_code, headers=cache_headers)
 
 
 @router.get("/episodes/{episode_id}/transcription", response_model=TranscriptionResponse)
@@ -1436,7 +1516,7 @@ async def get_transcription(
     db: AsyncSession = Depends(get_db)
 ):
     # Verify ownership
-    await verify_episode_ownership(episode_id, current_user, db)
+    await check_episode_ownership(episode_id, current_user, db)
 
     result = await db.execute(select(Transcription).where(Transcription.episode_id == episode_id))
     transcript = result.scalar_one_or_none()
@@ -1447,6 +1527,41 @@ async def get_transcription(
     return transcript
 
 
+# Filename slug patterns, compiled once
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+_SLUG_JOIN = re.compile(r"[-\s]+")
+
+
+def _slugify_filename(text: str) -> str:
+    """Convert text to safe filename"""
+    text = _SLUG_JOIN.sub("_", _SLUG_STRIP.sub("", text.lower()))
+    return text[:100]  # Limit length
+
+
+# Characters per chunk when streaming a transcript download
+TRANSCRIPT_CHUNK_CHARS = 65536
+
+# Transcript text split into ordered chunks by Postgres, so the full text never sits in memory at once
+_TRANSCRIPT_CHUNKS_STMT = text("""
+    SELECT substr(t.text, g.i * :size + 1, :size)
+    FROM transcriptions t
+    CROSS JOIN LATERAL generate_series(0, (length(t.text) - 1) / :size) AS g(i)
+    WHERE t.episode_id = :episode_id
+    ORDER BY g.i
+""")
+
+
+async def _stream_transcript(episode_id: UUID):
+    """Yield a transcript's text as UTF-8 chunks"""
+    # Own connection - the request's dependency may be closed before streaming finishes
+    async with engine.connect() as conn:
+        result = await conn.stream(
+            _TRANSCRIPT_CHUNKS_STMT, {"episode_id": episode_id, "size": TRANSCRIPT_CHUNK_CHARS}
+        )
+        async for chunk in result.scalars():
+            yield chunk.encode()
+
+
 @router.get("/episodes/{episode_id}/transcription/download")
 async def download_transcription(
     episode_id: UUID,
@@ -1454,48 +1569,27 @@ async def download_transcription(
     db: AsyncSession = Depends(get_db)
 ):
     """Download episode transcription as plain text file"""
-    import re
+    from fastapi.responses import StreamingResponse
 
-    from fastapi.responses import Response
+    # Verify ownership (episode comes back with its podcast for the filename)
+    episode = await verify_episode_ownership(episode_id, current_user, db, load_podcast=True)
+    podcast = episode.podcast
 
-    # Verify ownership
-    await verify_episode_ownership(episode_id, current_user, db)
-
-    # Get transcription
+    # Check the transcription exists without loading its text - the body is streamed below
     transcript_result = await db.execute(
-        select(Transcription).where(Transcription.episode_id == episode_id)
+        select(Transcription.id).where(Transcription.episode_id == episode_id)
     )
-    transcript = transcript_result.scalar_one_or_none()
-
-    if not transcript:
+    if transcript_result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Transcription not found")
 
-    # Get episode and podcast for filename
-    episode_result = await db.execute(select(Episode).where(Episode.id == episode_id))
-    episode = episode_result.scalar_one_or_none()
-
-    if not episode:
-        raise HTTPException(status_code=404, detail="Episode not found")
-
-    # Get podcast
-    podcast_result = await db.execute(select(Podcast).where(Podcast.id == episode.podcast_id))
-    podcast = podcast_result.scalar_one_or_none()
-
     # Create filename from podcast and episode titles
-    def slugify(text: str) -> str:
-        """Convert text to safe filename"""
-        text = text.lower()
-        text = re.sub(r"[^\w\s-]", "", text)
-        text = re.sub(r"[-\s]+", "_", text)
-        return text[:100]  # Limit length
-
-    podcast_slug = slugify(podcast.title) if podcast else "podcast"
-    episode_slug = slugify(episode.title)
+    podcast_slug = _slugify_filename(podcast.title) if podcast else "podcast"
+    episode_slug = _slugify_filename(episode.title)
     filename = f"{podcast_slug}_{episode_slug}_transcript.txt"
 
-    # Return as downloadable text file
-    return Response(
-        content=transcript.text,
+    # Return as downloadable text file, streamed in chunks
+    return StreamingResponse(
+        _stream_transcript(episode_id),
         media_type="text/plain; charset=utf-8",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -1509,12 +1603,12 @@ async def get_hidden_terms_count(
 ):
     """Get count of hidden terms for an episode"""
     # Verify ownership
-    await verify_episode_ownership(episode_id, current_user, db)
+    await check_episode_ownership(episode_id, current_user, db)
 
-    result = await db.execute(
-        select(func.count(Term.id)).where(Term.episode_id == episode_id, Term.hidden == 1)
+    # count(*) over ix_terms_episode_hidden - no column has to be read from the heap
+    count = await db.scalar(
+        select(func.count()).select_from(Term).where(Term.episode_id == episode_id, Term.hidden == 1)
     )
-    count = result.scalar()
     return {"count": count}
 
 
@@ -1526,17 +1620,16 @@ async def get_terms(
     db: AsyncSession = Depends(get_db)
 ):
     """Get terms for an episode, excluding hidden terms by default"""
-    from sqlalchemy import case
-
     # Verify ownership
-    await verify_episode_ownership(episode_id, current_user, db)
+    await check_episode_ownership(episode_id, current_user, db)
 
     query = select(Term).where(Term.episode_id == episode_id)
     if not include_hidden:
         query = query.where(Term.hidden == 0)
 
-    # Sort: manual terms first, then by created_at desc
-    query = query.order_by(case((Term.source == "manual", 0), else_=1), Term.created_at.desc())
+    # Sort: manual terms first, then by created_at desc. The rank is inlined SQL (not bound
+    # parameters) so it matches ix_terms_episode_visible_order and Postgres skips the sort
+    query = query.order_by(text(TERM_SOURCE_RANK_SQL), Term.created_at.desc())
     result = await db.execute(query)
     return result.scalars().all()
 
@@ -1579,6 +1672,7 @@ async def create_term(
     explanation: str = Body(None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ):
     """Manually create a term for an episode"""
     from app.services import transcription
@@ -1586,15 +1680,24 @@ async def create_term(
     # Verify ownership
     episode = await verify_episode_ownership(episode_id, current_user, db)
 
-    # Check if term already exists for this episode
+    # Check if term already exists for this episode (before paying for an embedding)
     existing_term = await db.execute(
-        select(Term).where(Term.episode_id == episode_id, Term.term.ilike(term))
+        select(Term.id).where(Term.episode_id == episode_id, Term.term.ilike(term)).limit(1)
     )
     if existing_term.scalar_one_or_none():
         raise HTTPException(status_code=400, detail="Term already exists for this episode")
 
-    # Generate embedding for term
-    term_embedding = await transcription.generate_embedding(term)
+    # Generate embedding for term, reusing a cached one for the same text and model
+    cache_key = (
+        f"term_embedding:{settings.embedding_model}:"
+        f"{hashlib.blake2b(term.strip().encode(), digest_size=16).hexdigest()}"
+    )
+    cached_embedding = await redis.get(cache_key)
+    if cached_embedding is not None:
+        term_embedding = orjson.loads(cached_embedding)
+    else:
+        term_embedding = await transcription.generate_embedding(term)
+        await redis.setex(cache_key, TERM_EMBEDDING_CACHE_TTL, orjson.dumps(term_embedding))
 
     # Create term
     new_term = Term(
@@ -1619,7 +1722,7 @@ async def get_summary(
     db: AsyncSession = Depends(get_db)
 ):
     # Verify ownership
-    await verify_episode_ownership(episode_id, current_user, db)
+    await check_episode_ownership(episode_id, current_user, db)
 
     result = await db.execute(select(Summary).where(Summary.episode_id == episode_id))
     summary = result.scalar_one_or_none()
@@ -1631,60 +1734,96 @@ async def get_summary(
 
 
 async def update_podcast_counts(podcast_id: UUID, db: AsyncSession):
-    """Update episode_count, processed_count, and latest_episode_date for a podcast"""
-    # Get episode count
-    episode_count_result = await db.execute(
-        select(func.count(Episode.id)).where(Episode.podcast_id == podcast_id)
-    )
-    episode_count = episode_count_result.scalar()
-
-    # Get processed count (episodes with summaries)
-    processed_count_result = await db.execute(
-        select(func.count(Episode.id))
-        .join(Summary, Summary.episode_id == Episode.id)
+    """Update episode_count, processed_count, and latest_episode_date for a podcast (caller commits)"""
+    # All three counters from one scan of the podcast's episodes (an aggregate always yields a row,
+    # so a podcast with no episodes is reset to zero)
+    stats = (
+        select(
+            func.count(Episode.id).label("episode_count"),
+            func.count(Summary.id).label("processed_count"),
+            func.max(Episode.published_at).label("latest_episode_date"),
+        )
+        .select_from(Episode)
+        .outerjoin(Summary, Summary.episode_id == Episode.id)
         .where(Episode.podcast_id == podcast_id)
+        .subquery()
     )
-    processed_count = processed_count_result.scalar()
 
-    # Get latest episode date
-    latest_date_result = await db.execute(
-        select(func.max(Episode.published_at)).where(Episode.podcast_id == podcast_id)
+    # UPDATE ... FROM the aggregate in the same round trip - list endpoints then sort on the stored columns.
+    # RETURNING + populate_existing keeps an already loaded Podcast in the session current
+    await db.execute(
+        update(Podcast)
+        .where(Podcast.id == podcast_id)
+        .values(
+            episode_count=stats.c.episode_count,
+            processed_count=stats.c.processed_count,
+            latest_episode_date=stats.c.latest_episode_date,
+        )
+        .returning(Podcast)
+        .execution_options(synchronize_session=False, populate_existing=True)
     )
-    latest_episode_date = latest_date_result.scalar()
 
-    # Update podcast
-    podcast_result = await db.execute(select(Podcast).where(Podcast.id == podcast_id))
-    podcast = podcast_result.scalar_one()
-    podcast.episode_count = episode_count
-    podcast.processed_count = processed_count
-    podcast.latest_episode_date = latest_episode_date
 
-    await db.commit()
+def _feed_metadata_values(podcast: Podcast, feed_data: dict) -> dict:
+    """Refreshed feed metadata (title, author, category, etc.) for a podcast as column values"""
+    # Only update image_url if it's not a custom uploaded image
+    # Custom images are stored as /echolens_data/uploads/{user_id}/{podcast_slug}/cover_{hash}.{ext}
+    # (cover.{ext} in older versions)
+    is_custom_image = (
+        podcast.image_url
+        and podcast.image_url.startswith("/echolens_data/uploads/")
+        and ("/cover_" in podcast.image_url or "/cover." in podcast.image_url)
+    )
 
+    return {
+        "title": feed_data.get("title", podcast.title),
+        "description": feed_data.get("description", podcast.description),
+        "author": feed_data.get("author", podcast.author),
+        "image_url": podcast.image_url if is_custom_image else feed_data.get("image_url", podcast.image_url),
+        "category": feed_data.get("category", podcast.category),
+    }
 
-async def fetch_episodes(podcast_id: UUID, rss_url: str, db: AsyncSession):
-    """Helper function to fetch and store episodes from RSS feed"""
-    episodes_data = rss_parser.parse_episodes(rss_url)
 
-    for ep_data in episodes_data:
-        # Check if episode already exists by audio_url (unique identifier)
+async def fetch_episodes(
+    podcast_id: UUID, rss_url: str, db: AsyncSession, episodes_data: list[dict] | None = None
+):
+    """Helper function to fetch and store episodes from RSS feed (episodes_data if already parsed; caller commits)"""
+    if episodes_data is None:
+        # Blocking HTTP fetch + XML parse - keep it off the event loop
+        episodes_data = await asyncio.to_thread(rss_parser.parse_episodes, rss_url)
+
+    # audio_url identifies an episode - a feed listing it twice keeps the later entry,
+    # and one upsert can't touch the same row twice
+    rows = list({ep["audio_url"]: {**ep, "podcast_id": podcast_id} for ep in episodes_data}.values())
+
+    if rows and await index_exists(db, "uq_episodes_podcast_audio_url"):
+        # Insert new episodes and update existing ones in one upsert (batched by the driver)
+        stmt = postgresql.insert(Episode)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Episode.podcast_id, Episode.audio_url],
+            set_={key: stmt.excluded[key] for key in rows[0] if key not in ("podcast_id", "audio_url")},
+        )
+        await db.execute(stmt, rows)
+    elif rows:
+        # No conflict target yet - duplicate episodes are blocking the unique index (see
+        # add_episode_audio_url_unique.sql); update every copy of an existing episode
         result = await db.execute(
             select(Episode).where(
-                Episode.podcast_id == podcast_id, Episode.audio_url == ep_data["audio_url"]
+                Episode.podcast_id == podcast_id,
+                Episode.audio_url.in_([row["audio_url"] for row in rows]),
             )
         )
-        existing_episode = result.scalar_one_or_none()
-
-        if existing_episode:
-            # Update existing episode
-            for key, value in ep_data.items():
-                setattr(existing_episode, key, value)
-        else:
-            # Create new episode
-            episode = Episode(podcast_id=podcast_id, **ep_data)
-            db.add(episode)
-
-    await db.commit()
+        existing: dict[str, list[Episode]] = {}
+        for episode in result.scalars():
+            existing.setdefault(episode.audio_url, []).append(episode)
+
+        for row in rows:
+            for episode in existing.get(row["audio_url"], ()):
+                for key, value in row.items():
+                    setattr(episode, key, value)
+            if row["audio_url"] not in existing:
+                db.add(Episode(**row))
+        await db.flush()
 
     # Update episode counts
     await update_podcast_counts(podcast_id, db)
@@ -1695,7 +1834,8 @@ async def get_playback_progress(
     podcast_id: UUID,
     episode_id: UUID,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ):
     """Get saved playback progress for an episode (user-specific)"""
     from fastapi.responses import JSONResponse
@@ -1703,7 +1843,12 @@ async def get_playback_progress(
     from app.models.podcast import PlaybackProgress
 
     # Verify ownership
-    await verify_podcast_ownership(podcast_id, current_user, db)
+    await check_podcast_ownership(podcast_id, current_user, db)
+
+    # A position saved since the last flush is newer than the database row
+    buffered = await playback_progress.get_buffered_progress(redis, current_user.id, episode_id)
+    if buffered:
+        return JSONResponse(buffered)
 
     # Get user-specific progress
     result = await db.execute(
@@ -1722,49 +1867,32 @@ async def get_playback_progress(
     )
 
 
+class PlaybackProgressUpdate(BaseModel):
+    # Whole seconds; bounded to fit the INTEGER column the buffered value is flushed to
+    current_time: int = Field(0, ge=0, le=2_147_483_647)
+
+
 @router.post("/{podcast_id}/episodes/{episode_id}/playback-progress")
 async def save_playback_progress(
     podcast_id: UUID,
     episode_id: UUID,
-    request: Request,
+    progress: PlaybackProgressUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ):
     """Save or update playback progress for an episode (user-specific)"""
     from fastapi.responses import JSONResponse
 
-    from app.models.podcast import PlaybackProgress
-
     # Verify ownership
-    await verify_podcast_ownership(podcast_id, current_user, db)
+    await check_podcast_ownership(podcast_id, current_user, db)
 
-    # Get request body
-    body = await request.json()
-    current_time = body.get("current_time", 0)
+    current_time = progress.current_time
 
-    # Check if user-specific progress already exists
-    result = await db.execute(
-        select(PlaybackProgress).where(
-            PlaybackProgress.episode_id == episode_id,
-            PlaybackProgress.user_id == current_user.id
-        )
+    # Buffered in Redis; the flush_playback_progress task upserts it into the database
+    await playback_progress.save_progress(
+        redis, current_user.id, episode_id, current_time, get_utc_now()
     )
-    progress = result.scalar_one_or_none()
-
-    if progress:
-        # Update existing
-        progress.current_time = current_time
-        progress.last_updated = get_utc_now()
-    else:
-        # Create new user-specific progress
-        progress = PlaybackProgress(
-            episode_id=episode_id,
-            current_time=current_time,
-            user_id=current_user.id
-        )
-        db.add(progress)
-
-    await db.commit()
 
     return JSONResponse({"status": "saved", "current_time": current_time})
 
@@ -1774,7 +1902,8 @@ async def delete_playback_progress(
     podcast_id: UUID,
     episode_id: UUID,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ):
     """Delete playback progress (when episode is finished) - user-specific"""
     from fastapi.responses import JSONResponse
@@ -1783,14 +1912,17 @@ async def delete_playback_progress(
     from app.models.podcast import PlaybackProgress
 
     # Verify ownership
-    await verify_podcast_ownership(podcast_id, current_user, db)
+    await check_podcast_ownership(podcast_id, current_user, db)
 
-    # Delete only this user's progress
+    # Delete only this user's progress, buffered and stored
+    await playback_progress.discard_progress(redis, current_user.id, episode_id)
     await db.execute(
-        sql_delete(PlaybackProgress).where(
+        sql_delete(PlaybackProgress)
+        .where(
             PlaybackProgress.episode_id == episode_id,
             PlaybackProgress.user_id == current_user.id
         )
+        .execution_options(synchronize_session=False)
     )
     await db.commit()
 
@@ -1809,13 +1941,10 @@ async def get_episode_notes(
     db: AsyncSession = Depends(get_db),
 ):
     """Get user notes for an episode"""
-    # Verify ownership
-    await verify_podcast_ownership(podcast_id, current_user, db)
-
-    result = await db.execute(select(Episode).where(Episode.id == episode_id))
-    episode = result.scalar_one_or_none()
+    # Verify ownership - one query, the podcast is only joined for the owner filter
+    episode = await verify_episode_ownership(episode_id, current_user, db)
 
-    if not episode:
+    if episode.podcast_id != podcast_id:
         raise HTTPException(status_code=404, detail="Episode not found")
 
     return {"notes": episode.notes or ""}
@@ -1830,13 +1959,10 @@ async def save_episode_notes(
     db: AsyncSession = Depends(get_db),
 ):
     """Save user notes for an episode"""
-    # Verify ownership
-    await verify_podcast_ownership(podcast_id, current_user, db)
-
-    result = await db.execute(select(Episode).where(Episode.id == episode_id))
-    episode = result.scalar_one_or_none()
+    # Verify ownership - one query, the podcast is only joined for the owner filter
+    episode = await verify_episode_ownership(episode_id, current_user, db)
 
-    if not episode:
+    if episode.podcast_id != podcast_id:
         raise HTTPException(status_code=404, detail="Episode not found")
 
     episode.notes = notes_data.notes
@@ -1845,6 +1971,28 @@ async def save_episode_notes(
     return {"status": "success"}
 
 
+# Notes markdown cleanup in one pass: a line break followed by any number of empty or
+# whitespace-only lines becomes a single blank line
+_BLANK_LINES = re.compile(r"\n(?:[^\S\n]*\n)+")
+# Download filename sanitizing
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w \-]")
+
+
+def _notes_to_markdown(notes: str) -> str:
+    """Convert HTML notes to cleaned-up markdown (CPU-bound - run it off the event loop)"""
+    import html2text
+
+    # A fresh converter per call - HTML2Text keeps parse state on the instance
+    h = html2text.HTML2Text()
+    h.ignore_links = False
+    h.ignore_images = False
+    h.body_width = 0  # Don't wrap text
+
+    markdown_content = h.handle(notes)
+    # Collapse whitespace-only and excessive blank lines, then strip leading/trailing whitespace
+    return _BLANK_LINES.sub("\n\n", markdown_content).strip()
+
+
 @router.get("/{podcast_id}/episodes/{episode_id}/notes/download")
 async def download_episode_notes(
     podcast_id: UUID,
@@ -1853,40 +2001,21 @@ async def download_episode_notes(
     db: AsyncSession = Depends(get_db),
 ):
     """Download episode notes as markdown file"""
-    # Verify ownership
-    await verify_podcast_ownership(podcast_id, current_user, db)
-
-    result = await db.execute(
-        select(Episode).options(selectinload(Episode.podcast)).where(Episode.id == episode_id)
-    )
-    episode = result.scalar_one_or_none()
+    # Verify ownership - one query, the podcast is only joined for the owner filter
+    episode = await verify_episode_ownership(episode_id, current_user, db)
 
-    if not episode:
+    if episode.podcast_id != podcast_id:
         raise HTTPException(status_code=404, detail="Episode not found")
 
-    # Convert HTML to markdown (basic conversion)
-    import re
-
-    import html2text
-
-    h = html2text.HTML2Text()
-    h.ignore_links = False
-    h.ignore_images = False
-    h.body_width = 0  # Don't wrap text
-
+    # Convert HTML to markdown (basic conversion) in a worker thread - large notes would
+    # otherwise stall every other request on the event loop
     if episode.notes:
-        markdown_content = h.handle(episode.notes)
-        # Remove lines that only contain whitespace
-        markdown_content = re.sub(r"^\s+$", "", markdown_content, flags=re.MULTILINE)
-        # Clean up excessive blank lines (more than 2 consecutive newlines)
-        markdown_content = re.sub(r"\n{3,}", "\n\n", markdown_content)
-        # Strip leading/trailing whitespace
-        markdown_content = markdown_content.strip()
+        markdown_content = await asyncio.to_thread(_notes_to_markdown, episode.notes)
     else:
         markdown_content = "# No notes yet\n\nStart taking notes about this episode."
 
     # Create filename
-    safe_title = "".join(c for c in episode.title if c.isalnum() or c in (" ", "-", "_")).rstrip()
+    safe_title = _UNSAFE_FILENAME_CHARS.sub("", episode.title).rstrip()
     filename = f"{safe_title[:50]}_notes.md"
 
     return Response(
@@ -1904,21 +2033,20 @@ async def get_all_processing_episodes(
     """Get all episode IDs that are currently being processed for user's podcasts"""
     from app.models.podcast import TaskHistory
 
-    # Get all active or pending tasks for user's podcasts
+    # Get all active or pending tasks for user's podcasts - task_history carries podcast_id,
+    # so no join is needed (all users, including admins, only see their own content)
+    user_podcast_ids = select(Podcast.id).where(Podcast.user_id == current_user.id)
     query = (
         select(TaskHistory.episode_id)
-        .join(Episode, Episode.id == TaskHistory.episode_id)
-        .join(Podcast, Podcast.id == Episode.podcast_id)
-        .where(TaskHistory.status.in_(["PENDING", "PROGRESS"]))
-        .where(TaskHistory.episode_id.isnot(None))
+        .where(
+            TaskHistory.status.in_(["PENDING", "PROGRESS"]),
+            TaskHistory.podcast_id.in_(user_podcast_ids),
+        )
         .distinct()
     )
 
-    # Filter by user - all users (including admins) only see their own content
-    query = query.where(Podcast.user_id == current_user.id)
-
     result = await db.execute(query)
-    episode_ids = [str(row[0]) for row in result.all()]
+    episode_ids = [str(episode_id) for episode_id in result.scalars()]
 
     return {"processing_episode_ids": episode_ids}
 
@@ -1933,7 +2061,7 @@ async def get_episode_processing_status(
     from app.models.podcast import TaskHistory
 
     # Verify ownership
-    await verify_episode_ownership(episode_id, current_user, db)
+    await check_episode_ownership(episode_id, current_user, db)
 
     # Check for active or pending tasks for this episode
     result = await db.execute(
@@ -1967,16 +2095,13 @@ async def process_episode_endpoint(
     # Verify ownership
     episode = await verify_episode_ownership(episode_id, current_user, db)
 
-    # Queue the processing task
-    task = process_episode_task.delay(str(episode_id))
+    # Queue the processing task (publishing to the broker is a blocking call)
+    task = await asyncio.to_thread(process_episode_task.delay, str(episode_id))
 
-    # Create task history record
+    # Task history record and notification go out in the same flush and transaction
     task_history = TaskHistory(
         task_id=task.id, episode_id=episode_id, podcast_id=episode.podcast_id, status="PENDING"
     )
-    db.add(task_history)
-
-    # Create notification
     notification = Notification(
         type="task_event",
         title="Episode Queued for Processing",
@@ -1987,7 +2112,7 @@ async def process_episode_endpoint(
         podcast_id=episode.podcast_id,
         user_id=current_user.id,
     )
-    db.add(notification)
+    db.add_all([task_history, notification])
 
     await db.commit()
 
@@ -2007,42 +2132,13 @@ async def upload_podcast_image(
     db: AsyncSession = Depends(get_db)
 ):
     """Upload a custom image for a podcast with security validation"""
-    import io
+    import tempfile
 
     from PIL import Image
 
     # Verify ownership
     podcast = await verify_podcast_ownership(podcast_id, current_user, db)
 
-    # 1. Size validation (5MB max)
-    MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(status_code=400, detail="File too large (max 5MB)")
-
-    # 2. Content-based MIME type validation (not just header)
-    mime = None
-    try:
-        import magic
-
-        mime = magic.from_buffer(content, mime=True)
-        allowed_mimes = ["image/jpeg", "image/png", "image/webp"]
-        if mime not in allowed_mimes:
-            raise HTTPException(status_code=400, detail=f"Invalid image type. Detected: {mime}")
-    except ImportError:
-        # Fallback if python-magic not available
-        pass
-
-    # 3. Validate image integrity and detect format
-    try:
-        img = Image.open(io.BytesIO(content))
-        img.verify()  # Verify it's actually a valid image
-        # Re-open to get format (verify() makes image unusable)
-        img = Image.open(io.BytesIO(content))
-        image_format = img.format.lower() if img.format else None
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Corrupted or invalid image: {e!s}")
-
     # Get user-specific storage path
     storage_path = get_user_storage_path(podcast.user_id, podcast.title)
     podcast_dir = Path(storage_path)
@@ -2053,36 +2149,77 @@ async def upload_podcast_image(
     if not str(podcast_dir).startswith(str(uploads_base)):
         raise HTTPException(status_code=400, detail="Invalid directory path")
 
-    podcast_dir.mkdir(parents=True, exist_ok=True)
+    # 1. Stream to a temp file under the uploads dir (size-checked and hashed as it arrives), so
+    # the upload is never held in memory and is moved into place without a second write; the
+    # podcast's directory is only created once the image has passed validation
+    uploads_base.mkdir(parents=True, exist_ok=True)
+    MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+    chunk_size = 64 * 1024
+    # Only 32 bits are kept for the filename - BLAKE2b is faster than SHA-256 and in the stdlib
+    hasher = hashlib.blake2b(digest_size=4)
+    size = 0
+    with tempfile.NamedTemporaryFile(dir=uploads_base, prefix=".upload_", delete=False) as tmp:
+        tmp_path = Path(tmp.name)
 
-    # Generate secure filename with hash
-    import hashlib
+    try:
+        with tmp_path.open("wb") as buffer:
+            while chunk := await file.read(chunk_size):
+                size += len(chunk)
+                if size > MAX_FILE_SIZE:
+                    raise HTTPException(status_code=400, detail="File too large (max 5MB)")
+                buffer.write(chunk)
+                hasher.update(chunk)
+
+        # 2. Content-based MIME type validation (not just header)
+        mime = None
+        try:
+            import magic
+
+            mime = magic.from_file(str(tmp_path), mime=True)
+            allowed_mimes = ["image/jpeg", "image/png", "image/webp"]
+            if mime not in allowed_mimes:
+                raise HTTPException(status_code=400, detail=f"Invalid image type. Detected: {mime}")
+        except ImportError:
+            # Fallback if python-magic not available
+            pass
 
-    file_hash = hashlib.sha256(content).hexdigest()[:8]
+        # 3. Validate image integrity and detect format
+        try:
+            with Image.open(tmp_path) as img:
+                img.verify()  # Verify it's actually a valid image
+            # Re-open to get format (verify() makes image unusable)
+            with Image.open(tmp_path) as img:
+                image_format = img.format.lower() if img.format else None
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"Corrupted or invalid image: {e!s}")
 
-    # Determine file extension from mime type or PIL format
-    if mime:
-        ext = mime.split("/")[-1]
-    elif image_format:
-        ext = "jpg" if image_format == "jpeg" else image_format
-    else:
-        ext = "jpg"  # Fallback
+        # Generate secure filename with hash
+        file_hash = hasher.hexdigest()
 
-    filename = f"cover_{file_hash}.{ext}"
-    file_path = podcast_dir / filename
+        # Determine file extension from mime type or PIL format
+        if mime:
+            ext = mime.split("/")[-1]
+        elif image_format:
+            ext = "jpg" if image_format == "jpeg" else image_format
+        else:
+            ext = "jpg"  # Fallback
 
-    # Save file with restrictive permissions
-    try:
-        import os
+        filename = f"cover_{file_hash}.{ext}"
+        file_path = podcast_dir / filename
 
-        with open(file_path, "wb") as buffer:
-            buffer.write(content)
-        os.chmod(file_path, 0o644)  # Read-only for group/others
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to save image: {e!s}")
+        # Move into place with restrictive permissions (atomic - same filesystem)
+        try:
+            podcast_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.chmod(0o644)  # Read-only for group/others
+            tmp_path.replace(file_path)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to save image: {e!s}")
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
-    # Update podcast image_url in database
-    podcast.image_url = f"/echolens_data/uploads/{podcast_slug}/{filename}"
+    # Update podcast image_url in database - the file's path under /echolens_data, i.e.
+    # /echolens_data/uploads/{user_id}/{podcast_slug}/cover_{hash}.{ext}
+    podcast.image_url = f"/{storage_path}/{filename}"
     await db.commit()
 
     return {"status": "success", "image_url": podcast.image_url}
@@ -1,5 +1,7 @@
 """Helper functions for podcast authorization and user filtering."""
 
+import re
+import time
 from uuid import UUID
 
 from fastapi import HTTPException, status
@@ -9,11 +11,29 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.podcast import Episode, Podcast
 from app.models.user import User
 
+# Seconds a user's owned podcast ids stay cached (also invalidated when a podcast is deleted)
+PODCAST_IDS_CACHE_TTL = 30
+
+# user_id -> (expires_at, podcast ids)
+_podcast_ids_cache: dict[UUID, tuple[float, frozenset[UUID]]] = {}
+
+# Podcast title -> storage directory slug
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+_SLUG_JOIN = re.compile(r"[-\s]+")
+
+# Max cached episode -> podcast ids; the cache is cleared wholesale when it fills up
+EPISODE_PODCAST_CACHE_SIZE = 10000
+
+# episode_id -> podcast_id (episodes never move between podcasts, so entries don't go stale)
+_episode_podcast_cache: dict[UUID, UUID] = {}
+
 
 async def verify_podcast_ownership(
     podcast_id: UUID,
     current_user: User,
-    db: AsyncSession
+    db: AsyncSession,
+    *,
+    options: tuple = ()
 ) -> Podcast:
     """
     Verify that the current user owns the podcast.
@@ -22,6 +42,7 @@ async def verify_podcast_ownership(
         podcast_id: Podcast UUID
         current_user: Current authenticated user
         db: Database session
+        options: Loader options (e.g. selectinload) applied to the podcast query
 
     Returns:
         Podcast if user is owner or admin
@@ -29,29 +50,100 @@ async def verify_podcast_ownership(
     Raises:
         HTTPException: 404 if not found, 403 if not authorized
     """
-    result = await db.execute(select(Podcast).where(Podcast.id == podcast_id))
+    # Users can only access their own podcasts (including admins) - the owner filter is part
+    # of the query, so a single round trip both authorizes and loads the podcast
+    stmt = select(Podcast).where(Podcast.id == podcast_id, Podcast.user_id == current_user.id)
+    if options:
+        stmt = stmt.options(*options)
+
+    result = await db.execute(stmt)
     podcast = result.scalar_one_or_none()
 
-    if not podcast:
+    if podcast:
+        return podcast
+
+    # Denied path only: tell a missing podcast apart from someone else's
+    exists = await db.scalar(select(select(Podcast.id).where(Podcast.id == podcast_id).exists()))
+    if not exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Podcast not found"
         )
 
-    # Users can only access their own podcasts (including admins)
-    if str(podcast.user_id) != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to access this podcast"
-        )
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="You don't have permission to access this podcast"
+    )
 
-    return podcast
+
+async def get_user_podcast_ids(current_user: User, db: AsyncSession) -> frozenset[UUID]:
+    """
+    Get the ids of the podcasts the current user owns, cached briefly per user.
+
+    Args:
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        Ids of the user's podcasts
+    """
+    cached = _podcast_ids_cache.get(current_user.id)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    result = await db.execute(select(Podcast.id).where(Podcast.user_id == current_user.id))
+    podcast_ids = frozenset(result.scalars().all())
+    _podcast_ids_cache[current_user.id] = (time.monotonic() + PODCAST_IDS_CACHE_TTL, podcast_ids)
+    return podcast_ids
+
+
+def invalidate_user_podcast_ids(user_id: UUID) -> None:
+    """Drop a user's cached podcast ids after one of their podcasts was deleted"""
+    _podcast_ids_cache.pop(user_id, None)
+
+
+def _remember_owned_podcast(user_id: UUID, podcast_id: UUID) -> None:
+    """Add a podcast verified as the user's to their cached ids, so the next check hits the cache"""
+    cached = _podcast_ids_cache.get(user_id)
+    if cached and cached[0] > time.monotonic():
+        _podcast_ids_cache[user_id] = (cached[0], cached[1] | {podcast_id})
+
+
+async def check_podcast_ownership(
+    podcast_id: UUID,
+    current_user: User,
+    db: AsyncSession
+) -> None:
+    """
+    Verify podcast ownership when the caller doesn't need the Podcast itself.
+
+    Served from the cached podcast ids; podcasts missing from the cache (e.g. added
+    by another worker since it was filled) fall back to verify_podcast_ownership.
+
+    Args:
+        podcast_id: Podcast UUID
+        current_user: Current authenticated user
+        db: Database session
+
+    Raises:
+        HTTPException: 404 if not found, 403 if not authorized
+    """
+    if podcast_id in await get_user_podcast_ids(current_user, db):
+        return
+
+    podcast = await verify_podcast_ownership(podcast_id, current_user, db)
+    # Only the caller's own podcasts belong in their cached ids
+    if podcast.user_id == current_user.id:
+        _remember_owned_podcast(current_user.id, podcast_id)
 
 
 async def verify_episode_ownership(
     episode_id: UUID,
     current_user: User,
-    db: AsyncSession
+    db: AsyncSession,
+    *,
+    load_podcast: bool = False,
+    options: tuple = ()
 ) -> Episode:
     """
     Verify that the current user owns the episode's podcast.
@@ -60,6 +152,8 @@ async def verify_episode_ownership(
         episode_id: Episode UUID
         current_user: Current authenticated user
         db: Database session
+        load_podcast: Populate Episode.podcast from the joined row (otherwise it raises on access)
+        options: Extra loader options (e.g. selectinload) applied to the episode query
 
     Returns:
         Episode if user is owner or admin
@@ -67,29 +161,72 @@ async def verify_episode_ownership(
     Raises:
         HTTPException: 404 if not found, 403 if not authorized
     """
-    from sqlalchemy.orm import selectinload
+    from sqlalchemy.orm import contains_eager, raiseload
 
+    # Users can only access episodes from their own podcasts (including admins) - the podcast
+    # is joined and filtered by owner in the same query; its columns are only selected when
+    # the caller needs Episode.podcast
+    podcast_loader = contains_eager(Episode.podcast) if load_podcast else raiseload(Episode.podcast)
     result = await db.execute(
         select(Episode)
-        .options(selectinload(Episode.podcast))
-        .where(Episode.id == episode_id)
+        .join(Episode.podcast)
+        .options(podcast_loader, *options)
+        .where(Episode.id == episode_id, Podcast.user_id == current_user.id)
     )
     episode = result.scalar_one_or_none()
 
-    if not episode:
+    if episode:
+        return episode
+
+    # Denied path only: tell a missing episode apart from someone else's
+    exists = await db.scalar(select(select(Episode.id).where(Episode.id == episode_id).exists()))
+    if not exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Episode not found"
         )
 
-    # Users can only access episodes from their own podcasts (including admins)
-    if str(episode.podcast.user_id) != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to access this episode"
-        )
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="You don't have permission to access this episode"
+    )
+
+
+async def check_episode_ownership(
+    episode_id: UUID,
+    current_user: User,
+    db: AsyncSession
+) -> None:
+    """
+    Verify episode ownership when the caller doesn't need the Episode itself.
 
-    return episode
+    The episode's podcast id comes from an in-process cache (one small query on a miss)
+    and is checked against the cached podcast ids; anything not served from the caches
+    falls back to verify_episode_ownership.
+
+    Args:
+        episode_id: Episode UUID
+        current_user: Current authenticated user
+        db: Database session
+
+    Raises:
+        HTTPException: 404 if not found, 403 if not authorized
+    """
+    podcast_id = _episode_podcast_cache.get(episode_id)
+    if podcast_id is None:
+        podcast_id = await db.scalar(select(Episode.podcast_id).where(Episode.id == episode_id))
+        if podcast_id is not None:
+            if len(_episode_podcast_cache) >= EPISODE_PODCAST_CACHE_SIZE:
+                _episode_podcast_cache.clear()
+            _episode_podcast_cache[episode_id] = podcast_id
+
+    if podcast_id is not None and podcast_id in await get_user_podcast_ids(current_user, db):
+        return
+
+    episode = await verify_episode_ownership(episode_id, current_user, db, load_podcast=True)
+    # Only the caller's own podcasts belong in their cached ids
+    if episode.podcast.user_id == current_user.id:
+        _remember_owned_podcast(current_user.id, episode.podcast_id)
 
 
 def apply_user_filter(query, current_user: User):
@@ -123,15 +260,8 @@ def get_user_storage_path(user_id: UUID, podcast_title: str) -> str:
     Returns:
         Path string for user's podcast storage
     """
-    import re
-
-    def slugify(text: str) -> str:
-        text = text.lower()
-        text = re.sub(r"[^\w\s-]", "", text)
-        text = re.sub(r"[-\s]+", "_", text)
-        return text.strip("_")[:100] or "unknown"
-
-    podcast_slug = slugify(podcast_title)
+    podcast_slug = _SLUG_JOIN.sub("_", _SLUG_STRIP.sub("", podcast_title.lower()))
+    podcast_slug = podcast_slug.strip("_")[:100] or "unknown"
     return f"echolens_data/uploads/{user_id}/{podcast_slug}"
 
 
@@ -154,15 +284,16 @@ async def verify_term_ownership(
     Raises:
         HTTPException: 404 if not found, 403 if not authorized
     """
-    from sqlalchemy.orm import selectinload
+    from sqlalchemy.orm import contains_eager
 
     from app.models.podcast import Term
 
+    # Episode and podcast are joined into the term query rather than loaded by two more selects
     result = await db.execute(
         select(Term)
-        .options(
-            selectinload(Term.episode).selectinload(Episode.podcast)
-        )
+        .join(Term.episode)
+        .join(Episode.podcast)
+        .options(contains_eager(Term.episode).contains_eager(Episode.podcast))
         .where(Term.id == term_id)
     )
     term = result.scalar_one_or_none()
@@ -174,7 +305,7 @@ async def verify_term_ownership(
         )
 
     # Verify ownership via episode->podcast chain
-    if not current_user.is_admin and str(term.episode.podcast.user_id) != str(current_user.id):
+    if not current_user.is_admin and term.episode.podcast.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to access this term"
@@ -27,6 +27,7 @@ from app.models.podcast import (
 from app.models.prompt import Prompt
 from app.models.settings import AppSetting
 from app.models.user import User
+from app.services import app_settings
 from app.services.prompt_loader import get_all_prompts, reset_prompt, update_prompt
 
 logger = structlog.get_logger(__name__)
@@ -83,10 +84,8 @@ async def get_require_user_approval(
     db: AsyncSession = Depends(get_db)
 ):
     """Get whether new user registrations require admin approval (admin only)"""
-    result = await db.execute(select(AppSetting).where(AppSetting.key == "require_user_approval"))
-    setting = result.scalar_one_or_none()
     # Default to True (require approval) if not set
-    return {"require_approval": setting.value == "true" if setting else True}
+    return {"require_approval": await app_settings.get_require_user_approval(db)}
 
 
 class RequireApprovalRequest(BaseModel):
@@ -111,6 +110,7 @@ async def update_require_user_approval(
         db.add(setting)
 
     await db.commit()
+    app_settings.invalidate_setting("require_user_approval")
 
     return {"success": True, "require_approval": request.require_approval}
 
@@ -42,7 +42,7 @@ async def get_task_logs(
         if task_record:
             # Verify ownership (unless admin)
             if not current_user.is_admin and task_record.podcast:
-                if str(task_record.podcast.user_id) != str(current_user.id):
+                if task_record.podcast.user_id != current_user.id:
                     raise HTTPException(status_code=403, detail="Not authorized to view this task")
             celery_task_id = task_record.task_id
     except ValueError:
@@ -196,7 +196,7 @@ async def get_task_detail_json(
         if task_record:
             # Verify ownership (unless admin)
             if not current_user.is_admin and task_record.podcast:
-                if str(task_record.podcast.user_id) != str(current_user.id):
+                if task_record.podcast.user_id != current_user.id:
                     raise HTTPException(status_code=403, detail="Not authorized to view this task")
             celery_task_id = task_record.task_id
     except ValueError:
@@ -214,7 +214,7 @@ async def get_task_detail_json(
         if task_record:
             # Verify ownership (unless admin)
             if not current_user.is_admin and task_record.podcast:
-                if str(task_record.podcast.user_id) != str(current_user.id):
+                if task_record.podcast.user_id != current_user.id:
                     raise HTTPException(status_code=403, detail="Not authorized to view this task")
             celery_task_id = task_record.task_id
 
@@ -329,7 +329,7 @@ async def cancel_task(
         if task_record:
             # Verify ownership (unless admin)
             if not current_user.is_admin and task_record.podcast:
-                if str(task_record.podcast.user_id) != str(current_user.id):
+                if task_record.podcast.user_id != current_user.id:
                     raise HTTPException(status_code=403, detail="Not authorized to cancel this task")
             celery_task_id = task_record.task_id
     except ValueError:
@@ -346,7 +346,7 @@ async def cancel_task(
         if task_record:
             # Verify ownership (unless admin)
             if not current_user.is_admin and task_record.podcast:
-                if str(task_record.podcast.user_id) != str(current_user.id):
+                if task_record.podcast.user_id != current_user.id:
                     raise HTTPException(status_code=403, detail="Not authorized to cancel this task")
             celery_task_id = task_record.task_id
 
@@ -417,17 +417,21 @@ async def clear_task_history(
     if current_user.is_admin:
         # Admin clears all tasks
         result = await db.execute(
-            delete(TaskHistory).where(TaskHistory.status.in_(["SUCCESS", "FAILURE", "CANCELLED"]))
+            delete(TaskHistory)
+            .where(TaskHistory.status.in_(["SUCCESS", "FAILURE", "CANCELLED"]))
+            .execution_options(synchronize_session=False)
         )
     else:
         # User clears only their podcast's tasks
         # We need to use a subquery to filter by podcast ownership
         user_podcasts_subquery = select(Podcast.id).where(Podcast.user_id == current_user.id)
         result = await db.execute(
-            delete(TaskHistory).where(
+            delete(TaskHistory)
+            .where(
                 TaskHistory.status.in_(["SUCCESS", "FAILURE", "CANCELLED"]),
                 TaskHistory.podcast_id.in_(user_podcasts_subquery)
             )
+            .execution_options(synchronize_session=False)
         )
 
     deleted_count = result.rowcount
@@ -59,6 +59,10 @@ def get_beat_schedule():
             "task": "cleanup_orphaned_tasks",
             "schedule": 300.0,  # Run every 5 minutes
         },
+        "flush-playback-progress": {
+            "task": "flush_playback_progress",
+            "schedule": 60.0,  # Buffered positions reach the database within a minute
+        },
         "refresh-all-podcasts-scheduled": {
             "task": "refresh_all_podcasts_scheduled",
             "schedule": crontab(hour=hour, minute=minute),  # Dynamic time from settings
@@ -1,29 +1,38 @@
 """Security dependencies for FastAPI authentication."""
 
+import time
+import uuid
+from typing import NamedTuple
 
 from fastapi import Cookie, Depends, HTTPException, status
-from redis.asyncio import Redis
+from redis.asyncio import BlockingConnectionPool, Redis
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.db.session import get_db
 from app.models.user import User
 from app.services.auth import get_session_user_id
 
+# Shared Redis connection pool - avoids a TCP connect/close on every request.
+# Blocking so a burst past max_connections waits for a free connection instead of raising.
+redis_pool = BlockingConnectionPool.from_url(
+    settings.redis_url,
+    decode_responses=False,
+    max_connections=100,
+    timeout=5,  # Seconds to wait for a connection before raising ConnectionError
+    health_check_interval=30,  # Ping idle connections before reuse to prune stale sockets
+)
+
 
 async def get_redis() -> Redis:
     """
     Get Redis connection for session management.
 
     Returns:
-        Redis connection instance
+        Redis client backed by the shared connection pool
     """
-    from app.core.config import settings
-
-    redis = Redis.from_url(settings.redis_url, decode_responses=False)
-    try:
-        yield redis
-    finally:
-        await redis.close()
+    yield Redis(connection_pool=redis_pool)
 
 
 async def get_current_user(
@@ -68,6 +77,87 @@ async def get_current_user(
     return user
 
 
+class UserContext(NamedTuple):
+    """Lightweight, session-independent view of the authenticated user"""
+
+    id: uuid.UUID
+    email: str
+    is_admin: bool
+
+
+# Seconds a user row stays cached for get_current_user_context
+USER_CACHE_TTL = 30
+USER_CACHE_MAX_SIZE = 10_000
+
+# user_id -> (expires_at, context)
+_user_cache: dict[uuid.UUID, tuple[float, UserContext]] = {}
+
+
+async def get_current_user_context(
+    session_id_cookie: str | None = Cookie(None, alias="session_id"),
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis)
+) -> UserContext:
+    """
+    Get the current user for read-mostly endpoints that only need the user's identity.
+
+    The session is still validated in Redis on every request (so logout is immediate),
+    but the users row is served from a short-lived in-process cache. Use get_current_user
+    instead when the endpoint needs to modify the User instance.
+
+    Args:
+        session_id_cookie: Session ID from cookie
+        db: Database session
+        redis: Redis connection
+
+    Returns:
+        UserContext for the current user
+
+    Raises:
+        HTTPException: 401 if not authenticated or session invalid
+    """
+    if not session_id_cookie:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated"
+        )
+
+    user_id = await get_session_user_id(session_id_cookie, redis)
+    if not user_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Session expired or invalid"
+        )
+
+    cached = _user_cache.get(user_id)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    result = await db.execute(
+        select(User.id, User.email, User.is_admin, User.is_active).where(User.id == user_id)
+    )
+    row = result.one_or_none()
+    # Return the connection to the pool now - callers of this dependency don't use the session
+    await db.close()
+    if not row or not row.is_active:
+        _user_cache.pop(user_id, None)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found or inactive"
+        )
+
+    if len(_user_cache) >= USER_CACHE_MAX_SIZE:
+        _user_cache.clear()
+    context = UserContext(id=row.id, email=row.email, is_admin=row.is_admin)
+    _user_cache[user_id] = (time.monotonic() + USER_CACHE_TTL, context)
+    return context
+
+
+def invalidate_user_context(user_id: uuid.UUID) -> None:
+    """Drop a cached user after their account has been changed"""
+    _user_cache.pop(user_id, None)
+
+
 async def get_current_admin(
     current_user: User = Depends(get_current_user)
 ) -> User:
@@ -10,8 +10,11 @@ logger = structlog.get_logger(__name__)
 # Support for local, Docker, and remote (Neon, etc.) PostgreSQL
 engine_config = {
     "echo": False,  # Set to True for SQL query debugging
+    "pool_size": 20,  # Steady-state connections (notification polling from every open tab)
+    "max_overflow": 40,  # Extra connections allowed during bursts
     "pool_pre_ping": True,  # Verify connections before using
-    "pool_recycle": 3600,  # Recycle connections after 1 hour
+    "pool_recycle": 1800,  # Recycle connections after 30 minutes
+    "query_cache_size": 1200,  # Compiled statement cache (default 500)
 }
 
 # Add SSL support and disable prepared statements for remote databases (Neon, etc.)
@@ -20,6 +23,20 @@ if "neon.tech" in settings.database_url or "ssl=require" in settings.database_ur
         "ssl": "require",
         "prepared_statement_cache_size": 0,  # Disable prepared statement cache
     }
+else:
+    # Keepalives and pool_recycle already catch dead connections, so skip the
+    # pre-ping round trip on every checkout (kept for remote poolers that drop idle links)
+    engine_config["pool_pre_ping"] = False
+    # TCP keepalives so dead connections are detected instead of hanging a request
+    # (not sent to remote poolers, which may reject unknown startup parameters)
+    engine_config["connect_args"] = {
+        "prepared_statement_cache_size": 500,  # asyncpg per-connection cache (default 100)
+        "server_settings": {
+            "tcp_keepalives_idle": "60",
+            "tcp_keepalives_interval": "30",
+            "tcp_keepalives_count": "3",
+        }
+    }
 
 engine = create_async_engine(settings.database_url, **engine_config)
 async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
@@ -30,6 +47,25 @@ async def get_db():
         yield session
 
 
+async def get_conn():
+    """Core connection for hot endpoints that don't need the ORM unit of work"""
+    async with engine.connect() as conn:
+        yield conn
+
+
+# Indexes seen to exist - checked until found, then never again (they aren't dropped at runtime)
+_existing_indexes: set[str] = set()
+
+
+async def index_exists(db: AsyncSession, name: str) -> bool:
+    """Whether an index exists yet (e.g. one apply_schema_updates() had to skip)"""
+    if name not in _existing_indexes and await db.scalar(
+        text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}
+    ):
+        _existing_indexes.add(name)
+    return name in _existing_indexes
+
+
 async def validate_vector_dimensions():
     """
     Validate that database vector column dimensions match EMBEDDING_DIMENSIONS from .env
@@ -152,10 +188,177 @@ async def apply_schema_updates():
             await conn.execute(text("ALTER TABLE terms ADD COLUMN source VARCHAR DEFAULT 'auto'"))
             logger.info("source_column_added", table="terms")
 
+        # Add full-text search column to transcriptions table if missing
+        result = await conn.execute(
+            text("""
+            SELECT EXISTS (
+                SELECT FROM information_schema.columns
+                WHERE table_name = 'transcriptions' AND column_name = 'text_tsv'
+            )
+        """)
+        )
+        has_tsv_column = result.scalar()
+
+        if not has_tsv_column:
+            logger.info("adding_text_tsv_column", table="transcriptions")
+            await conn.execute(
+                text(
+                    "ALTER TABLE transcriptions ADD COLUMN text_tsv tsvector "
+                    "GENERATED ALWAYS AS (to_tsvector('english', text)) STORED"
+                )
+            )
+            await conn.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS ix_transcriptions_text_tsv "
+                    "ON transcriptions USING gin (text_tsv)"
+                )
+            )
+            logger.info("text_tsv_column_added", table="transcriptions")
+
+        # Add full-text search column (plus trigram indexes) to episodes table if missing
+        result = await conn.execute(
+            text("""
+            SELECT EXISTS (
+                SELECT FROM information_schema.columns
+                WHERE table_name = 'episodes' AND column_name = 'search_tsv'
+            )
+        """)
+        )
+        has_search_tsv_column = result.scalar()
+
+        if not has_search_tsv_column:
+            logger.info("adding_search_tsv_column", table="episodes")
+            await conn.execute(
+                text(
+                    "ALTER TABLE episodes ADD COLUMN search_tsv tsvector "
+                    "GENERATED ALWAYS AS (to_tsvector('english', "
+                    "coalesce(title, '') || ' ' || coalesce(description, ''))) STORED"
+                )
+            )
+            await conn.execute(
+                text("CREATE INDEX IF NOT EXISTS ix_episodes_search_tsv ON episodes USING gin (search_tsv)")
+            )
+            await conn.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS ix_episodes_title_trgm "
+                    "ON episodes USING gin (title gin_trgm_ops)"
+                )
+            )
+            await conn.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS ix_episodes_description_trgm "
+                    "ON episodes USING gin (description gin_trgm_ops)"
+                )
+            )
+            logger.info("search_tsv_column_added", table="episodes")
+
+        # Unique (podcast_id, audio_url) on episodes - conflict target of the episode upsert in fetch_episodes
+        result = await conn.execute(
+            text("SELECT to_regclass('uq_episodes_podcast_audio_url') IS NOT NULL")
+        )
+        has_audio_url_unique = result.scalar()
+
+        if not has_audio_url_unique:
+            result = await conn.execute(
+                text("""
+                SELECT count(*) FROM (
+                    SELECT 1 FROM episodes GROUP BY podcast_id, audio_url HAVING count(*) > 1
+                ) AS duplicates
+            """)
+            )
+            duplicate_count = result.scalar()
+
+            if duplicate_count:
+                # Creating the index would fail, and deleting episodes would cascade to users'
+                # transcriptions, chats and progress - leave the cleanup to
+                # app/migrations/add_episode_audio_url_unique.sql. fetch_episodes updates
+                # row by row until the index exists.
+                logger.error("episode_audio_url_duplicates", table="episodes", duplicate_count=duplicate_count)
+            else:
+                logger.info("adding_audio_url_unique_index", table="episodes")
+                await conn.execute(
+                    text(
+                        "CREATE UNIQUE INDEX IF NOT EXISTS uq_episodes_podcast_audio_url "
+                        "ON episodes (podcast_id, audio_url)"
+                    )
+                )
+                await conn.execute(text("DROP INDEX IF EXISTS ix_episodes_podcast_audio_url"))
+                logger.info("audio_url_unique_index_added", table="episodes")
+
+        # Unique (episode_id, user_id) on playback_progress - conflict target of the progress upsert
+        result = await conn.execute(
+            text("SELECT to_regclass('uq_playback_progress_episode_user') IS NOT NULL")
+        )
+        has_progress_unique = result.scalar()
+
+        if not has_progress_unique:
+            logger.info("adding_playback_progress_unique_index", table="playback_progress")
+            # Duplicate rows are just stale positions - keep the most recently updated one
+            await conn.execute(
+                text("""
+                DELETE FROM playback_progress p
+                USING playback_progress newer
+                WHERE p.episode_id = newer.episode_id
+                  AND p.user_id = newer.user_id
+                  AND (COALESCE(newer.last_updated, '-infinity'), newer.id)
+                    > (COALESCE(p.last_updated, '-infinity'), p.id)
+            """)
+            )
+            await conn.execute(
+                text(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS uq_playback_progress_episode_user "
+                    "ON playback_progress (episode_id, user_id)"
+                )
+            )
+            logger.info("playback_progress_unique_index_added", table="playback_progress")
+
+        # NOTIFY trigger on notifications - /api/notifications/stream relies on it for updates
+        # (same SQL as app/migrations/add_notifications_notify_trigger.sql)
+        result = await conn.execute(
+            text("""
+            SELECT EXISTS (
+                SELECT FROM pg_trigger
+                WHERE tgname = 'notifications_changed' AND tgrelid = 'notifications'::regclass
+            )
+        """)
+        )
+        has_notify_trigger = result.scalar()
+
+        if not has_notify_trigger:
+            logger.info("adding_notify_trigger", table="notifications")
+            await conn.execute(
+                text("""
+                CREATE OR REPLACE FUNCTION notify_notifications_changed() RETURNS trigger AS $$
+                BEGIN
+                    IF TG_OP = 'DELETE' THEN
+                        IF OLD.user_id IS NOT NULL THEN
+                            PERFORM pg_notify('notifications_changed', OLD.user_id::text);
+                        END IF;
+                        RETURN OLD;
+                    END IF;
+
+                    IF NEW.user_id IS NOT NULL THEN
+                        PERFORM pg_notify('notifications_changed', NEW.user_id::text);
+                    END IF;
+                    RETURN NEW;
+                END;
+                $$ LANGUAGE plpgsql
+            """)
+            )
+            await conn.execute(
+                text("""
+                CREATE TRIGGER notifications_changed
+                    AFTER INSERT OR UPDATE OR DELETE ON notifications
+                    FOR EACH ROW EXECUTE FUNCTION notify_notifications_changed()
+            """)
+            )
+            logger.info("notify_trigger_added", table="notifications")
+
 
 async def init_db():
     async with engine.begin() as conn:
         await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
 
     # Apply any schema updates for existing tables
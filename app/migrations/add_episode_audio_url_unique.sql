@@ -0,0 +1,32 @@
+-- Migration: Unique (podcast_id, audio_url) on episodes
+-- fetch_episodes upserts with ON CONFLICT (podcast_id, audio_url), which needs a unique index to infer.
+-- It supersedes the plain ix_episodes_podcast_audio_url index from earlier versions.
+-- apply_schema_updates() adds the index on startup only when there are no duplicates; otherwise it
+-- logs episode_audio_url_duplicates and fetch_episodes falls back to row-by-row updates until this runs.
+-- Duplicate episodes are removed first, keeping one row per (podcast_id, audio_url): the one with
+-- chats, then a summary, a transcription, terms, playback progress, notes, then the oldest.
+-- Deleting the others cascades to all of their data - BACK UP FIRST. To review them beforehand:
+--   SELECT podcast_id, audio_url, count(*) FROM episodes GROUP BY 1, 2 HAVING count(*) > 1;
+-- Run outside a transaction (plain psql -f is fine).
+
+DELETE FROM episodes e
+USING (
+    SELECT id, row_number() OVER (
+        PARTITION BY podcast_id, audio_url
+        ORDER BY
+            EXISTS (SELECT 1 FROM chats c WHERE c.episode_id = episodes.id) DESC,
+            EXISTS (SELECT 1 FROM summaries s WHERE s.episode_id = episodes.id) DESC,
+            EXISTS (SELECT 1 FROM transcriptions t WHERE t.episode_id = episodes.id) DESC,
+            EXISTS (SELECT 1 FROM terms tm WHERE tm.episode_id = episodes.id) DESC,
+            EXISTS (SELECT 1 FROM playback_progress p WHERE p.episode_id = episodes.id) DESC,
+            (notes IS NOT NULL) DESC,
+            created_at ASC NULLS LAST,
+            id ASC
+    ) AS rn
+    FROM episodes
+) ranked
+WHERE e.id = ranked.id AND ranked.rn > 1;
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_episodes_podcast_audio_url ON episodes (podcast_id, audio_url);
+
+DROP INDEX CONCURRENTLY IF EXISTS ix_episodes_podcast_audio_url;
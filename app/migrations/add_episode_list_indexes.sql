@@ -0,0 +1,7 @@
+-- Migration: Composite index for per-podcast episode lists
+-- ix_episodes_podcast_published serves list_episodes (WHERE podcast_id = ? ORDER BY published_at DESC)
+-- straight from the index. Lookups by (podcast_id, audio_url) use the unique index from
+-- add_episode_audio_url_unique.sql.
+-- CONCURRENTLY avoids blocking writes on large tables - run outside a transaction (plain psql -f is fine).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_episodes_podcast_published ON episodes (podcast_id, published_at DESC);
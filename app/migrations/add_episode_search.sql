@@ -0,0 +1,16 @@
+-- Migration: Indexed episode search
+-- Replaces the sequential ILIKE scan in the episode list search with a GIN-indexed tsvector,
+-- plus trigram indexes so wildcard (ILIKE) searches can still use an index.
+-- Applied automatically on startup by init_db()/apply_schema_updates(); kept here for manual runs.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+ALTER TABLE episodes
+    ADD COLUMN IF NOT EXISTS search_tsv tsvector
+    GENERATED ALWAYS AS (to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))) STORED;
+
+CREATE INDEX IF NOT EXISTS ix_episodes_search_tsv ON episodes USING gin (search_tsv);
+
+CREATE INDEX IF NOT EXISTS ix_episodes_title_trgm ON episodes USING gin (title gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_episodes_description_trgm ON episodes USING gin (description gin_trgm_ops);
@@ -0,0 +1,6 @@
+-- Migration: Composite and partial indexes for notifications
+-- Serves the per-user newest-first listing and the unread-only updates/counts
+
+CREATE INDEX IF NOT EXISTS ix_notifications_user_created ON notifications (user_id, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS ix_notifications_unread ON notifications (user_id) WHERE read = 0;
@@ -0,0 +1,28 @@
+-- Migration: Publish notification changes with NOTIFY
+-- Any insert/update/delete on notifications sends the affected user_id on the
+-- notifications_changed channel, which /api/notifications/stream relays to the
+-- browser over server-sent events. Covers every writer (API and Celery workers).
+-- apply_schema_updates() installs the trigger on startup if it is missing; this script
+-- is for applying it by hand (or re-applying after editing the function).
+
+CREATE OR REPLACE FUNCTION notify_notifications_changed() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        IF OLD.user_id IS NOT NULL THEN
+            PERFORM pg_notify('notifications_changed', OLD.user_id::text);
+        END IF;
+        RETURN OLD;
+    END IF;
+
+    IF NEW.user_id IS NOT NULL THEN
+        PERFORM pg_notify('notifications_changed', NEW.user_id::text);
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS notifications_changed ON notifications;
+
+CREATE TRIGGER notifications_changed
+    AFTER INSERT OR UPDATE OR DELETE ON notifications
+    FOR EACH ROW EXECUTE FUNCTION notify_notifications_changed();
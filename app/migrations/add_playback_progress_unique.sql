@@ -0,0 +1,12 @@
+-- Migration: Unique (episode_id, user_id) on playback_progress
+-- save_playback_progress upserts with ON CONFLICT (episode_id, user_id), which needs a unique index to infer.
+-- Duplicate rows are stale positions, so all but the most recently updated one are removed first.
+
+DELETE FROM playback_progress p
+USING playback_progress newer
+WHERE p.episode_id = newer.episode_id
+  AND p.user_id = newer.user_id
+  AND (COALESCE(newer.last_updated, '-infinity'), newer.id)
+      > (COALESCE(p.last_updated, '-infinity'), p.id);
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_playback_progress_episode_user ON playback_progress (episode_id, user_id);
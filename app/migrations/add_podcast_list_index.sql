@@ -0,0 +1,6 @@
+-- Migration: Index for the default podcast list sort
+-- list_podcasts filters by user and orders by latest_episode_date DESC NULLS LAST,
+-- which this index serves directly without a sort step
+
+CREATE INDEX IF NOT EXISTS ix_podcasts_user_latest_episode
+    ON podcasts (user_id, latest_episode_date DESC NULLS LAST);
@@ -0,0 +1,7 @@
+-- Migration: Partial index on active tasks
+-- The processing-status poll looks up PENDING/PROGRESS tasks by podcast; finished tasks are
+-- the vast majority of task_history and are left out of the index.
+
+CREATE INDEX IF NOT EXISTS ix_task_history_podcast_active
+    ON task_history (podcast_id, status)
+    WHERE status IN ('PENDING', 'PROGRESS');
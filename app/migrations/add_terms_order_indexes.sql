@@ -0,0 +1,13 @@
+-- Migration: Ordered partial index for visible terms, partial index for hidden terms
+-- Term lists and the extraction-progress poll filter hidden = 0 and sort manual terms first,
+-- newest first; indexing the same expression lets Postgres read terms in order instead of sorting.
+-- Drops ix_terms_episode_visible, the plain partial index earlier versions created.
+
+CREATE INDEX IF NOT EXISTS ix_terms_episode_visible_order
+    ON terms (episode_id, (CASE WHEN source = 'manual' THEN 0 ELSE 1 END), created_at DESC)
+    WHERE hidden = 0;
+
+DROP INDEX IF EXISTS ix_terms_episode_visible;
+
+-- Hidden term counts per episode
+CREATE INDEX IF NOT EXISTS ix_terms_episode_hidden ON terms (episode_id) WHERE hidden = 1;
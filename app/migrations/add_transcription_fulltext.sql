@@ -0,0 +1,9 @@
+-- Migration: Full-text search column for transcriptions
+-- Replaces the unindexable regex (~*) scan in hybrid episode search with a GIN-indexed tsvector.
+-- Applied automatically on startup by apply_schema_updates(); kept here for manual runs.
+
+ALTER TABLE transcriptions
+    ADD COLUMN IF NOT EXISTS text_tsv tsvector
+    GENERATED ALWAYS AS (to_tsvector('english', text)) STORED;
+
+CREATE INDEX IF NOT EXISTS ix_transcriptions_text_tsv ON transcriptions USING gin (text_tsv);
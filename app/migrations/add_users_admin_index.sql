@@ -0,0 +1,4 @@
+-- Migration: Partial index on admin users
+-- Only admins are indexed, so last-admin checks and admin lookups stay index-only scans
+
+CREATE INDEX IF NOT EXISTS ix_users_is_admin_true ON users (id) WHERE is_admin = true;
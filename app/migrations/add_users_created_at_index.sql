@@ -0,0 +1,9 @@
+-- Migration: Index users for newest-first listing
+-- Lets the admin user list page with a (created_at, id) cursor (keyset pagination)
+-- instead of scanning and discarding OFFSET rows. id breaks ties between users created
+-- in the same transaction (e.g. a CSV import), which share created_at.
+
+CREATE INDEX IF NOT EXISTS ix_users_created_at_id_desc ON users (created_at DESC, id DESC);
+
+-- Earlier version of this index (id ascending - can't serve the row-value cursor)
+DROP INDEX IF EXISTS ix_users_created_at_id;
@@ -1,9 +1,9 @@
 import uuid
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, DateTime, ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.config import settings
 from app.core.timezone import get_utc_now
@@ -39,9 +39,36 @@ class Podcast(Base):
     user = relationship("User", back_populates="podcasts")
     episodes = relationship("Episode", back_populates="podcast", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Duplicate-feed check in add_podcast (also created by allow_duplicate_rss_urls.sql)
+        Index("idx_podcasts_user_rss", "user_id", "rss_url"),
+        # Default list sort (latest episode first) - see add_podcast_list_index.sql
+        Index("ix_podcasts_user_latest_episode", "user_id", text("latest_episode_date DESC NULLS LAST")),
+    )
+
 
 class Episode(Base):
     __tablename__ = "episodes"
+    __table_args__ = (
+        # Per-podcast episode list, already in published_at DESC order (no sort step)
+        Index("ix_episodes_podcast_published", "podcast_id", text("published_at DESC")),
+        # One episode per audio_url within a podcast - the conflict target of fetch_episodes' upsert
+        Index("uq_episodes_podcast_audio_url", "podcast_id", "audio_url", unique=True),
+        # Episode list search: full-text on title + description, trigram for wildcard (ILIKE) patterns
+        Index("ix_episodes_search_tsv", "search_tsv", postgresql_using="gin"),
+        Index(
+            "ix_episodes_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_episodes_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     podcast_id = Column(
@@ -55,6 +82,16 @@ class Episode(Base):
     published_at = Column(DateTime, index=True)  # Indexed for sorting/filtering by date
     created_at = Column(DateTime, default=get_utc_now)
     notes = Column(Text)  # User notes in markdown format
+    # Maintained by Postgres; deferred so loading an episode doesn't pull it
+    search_tsv = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))",
+                persisted=True,
+            ),
+        )
+    )
 
     podcast = relationship("Podcast", back_populates="episodes")
     transcription = relationship(
@@ -74,6 +111,10 @@ class Episode(Base):
 
 class Transcription(Base):
     __tablename__ = "transcriptions"
+    __table_args__ = (
+        # Full-text search over transcripts (hybrid episode search)
+        Index("ix_transcriptions_text_tsv", "text_tsv", postgresql_using="gin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     episode_id = Column(
@@ -83,14 +124,34 @@ class Transcription(Base):
         unique=True,
     )
     text = Column(Text, nullable=False)
+    # Maintained by Postgres; deferred so loading a transcription doesn't pull it
+    text_tsv = deferred(
+        Column(TSVECTOR, Computed("to_tsvector('english', text)", persisted=True))
+    )
     embedding = Column(Vector(VECTOR_DIMENSIONS))
     created_at = Column(DateTime, default=get_utc_now)
 
     episode = relationship("Episode", back_populates="transcription")
 
 
+# Term list order (manual terms first); queries must use this exact expression to match the index
+TERM_SOURCE_RANK_SQL = "CASE WHEN source = 'manual' THEN 0 ELSE 1 END"
+
+
 class Term(Base):
     __tablename__ = "terms"
+    __table_args__ = (
+        # Visible terms per episode in display order (term lists and extraction-progress polling)
+        Index(
+            "ix_terms_episode_visible_order",
+            "episode_id",
+            text(f"({TERM_SOURCE_RANK_SQL})"),
+            text("created_at DESC"),
+            postgresql_where=text("hidden = 0"),
+        ),
+        # Hidden term counts per episode
+        Index("ix_terms_episode_hidden", "episode_id", postgresql_where=text("hidden = 1")),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     episode_id = Column(
@@ -156,6 +217,15 @@ class TaskHistory(Base):
     """History of processing tasks for display in UI"""
 
     __tablename__ = "task_history"
+    __table_args__ = (
+        # Active tasks per podcast (processing-status polling); most tasks are finished, so it stays small
+        Index(
+            "ix_task_history_podcast_active",
+            "podcast_id",
+            "status",
+            postgresql_where=text("status IN ('PENDING', 'PROGRESS')"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     task_id = Column(String, unique=True, nullable=False, index=True)  # Celery task ID
@@ -186,6 +256,10 @@ class PlaybackProgress(Base):
     """Track audio playback position for resuming later"""
 
     __tablename__ = "playback_progress"
+    __table_args__ = (
+        # One position per user and episode - the conflict target of save_playback_progress' upsert
+        Index("uq_playback_progress_episode_user", "episode_id", "user_id", unique=True),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     user_id = Column(
@@ -251,6 +325,12 @@ class ChatMessage(Base):
 
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Per-user listing ordered by newest first (index range scan + early LIMIT)
+        Index("ix_notifications_user_created", "user_id", text("created_at DESC")),
+        # Small partial index for unread lookups and mark-all-read
+        Index("ix_notifications_unread", "user_id", postgresql_where=text("read = 0")),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     user_id = Column(
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -15,6 +15,12 @@ class User(Base):
     """User model for authentication and authorization."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Newest-first listing and keyset pagination in the admin user list
+        Index("ix_users_created_at_id_desc", text("created_at DESC"), text("id DESC")),
+        # Tiny partial index for admin-exists checks and admin notification fan-out
+        Index("ix_users_is_admin_true", "id", postgresql_where=text("is_admin = true")),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
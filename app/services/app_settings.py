@@ -0,0 +1,49 @@
+"""
+Cached access to application-wide settings stored in the app_settings table.
+Settings change rarely, so reads are served from a short-lived in-process cache.
+"""
+
+import time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.settings import AppSetting
+
+# Seconds a cached setting stays valid (bounds staleness across worker processes)
+SETTINGS_CACHE_TTL = 30
+
+# key -> (expires_at, value)
+_settings_cache: dict[str, tuple[float, str | None]] = {}
+
+
+async def get_setting(db: AsyncSession, key: str) -> str | None:
+    """
+    Get an app setting value, using the in-process cache when fresh.
+
+    Args:
+        db: Database session
+        key: Setting key, e.g. "require_user_approval"
+
+    Returns:
+        Setting value, or None if the setting has not been stored
+    """
+    cached = _settings_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    result = await db.execute(select(AppSetting.value).where(AppSetting.key == key))
+    value = result.scalar_one_or_none()
+    _settings_cache[key] = (time.monotonic() + SETTINGS_CACHE_TTL, value)
+    return value
+
+
+def invalidate_setting(key: str) -> None:
+    """Drop a setting from the cache after it has been updated"""
+    _settings_cache.pop(key, None)
+
+
+async def get_require_user_approval(db: AsyncSession) -> bool:
+    """Whether new users need admin approval (defaults to True when not set)"""
+    value = await get_setting(db, "require_user_approval")
+    return value == "true" if value is not None else True
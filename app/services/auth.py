@@ -1,5 +1,6 @@
 """Authentication service for password hashing and session management."""
 
+import asyncio
 import secrets
 import uuid
 
@@ -10,6 +11,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
+from app.services.app_settings import get_require_user_approval
 
 # Session configuration
 SESSION_TTL = 60 * 60 * 24 * 7  # 7 days in seconds
@@ -18,6 +20,9 @@ SESSION_PREFIX = "session:"
 # Password hasher instance
 ph = PasswordHasher()
 
+# Hash verified for unknown emails to keep login timing uniform
+_DUMMY_HASH = ph.hash(secrets.token_urlsafe(16))
+
 
 def hash_password(password: str) -> str:
     """
@@ -161,19 +166,14 @@ async def register_user(email: str, password: str, db: AsyncSession) -> User:
     # Check if user approval is required (for non-first users)
     require_approval = True  # Default to requiring approval
     if not is_first_user:
-        from app.models.settings import AppSetting
-        setting_stmt = select(AppSetting).where(AppSetting.key == "require_user_approval")
-        setting_result = await db.execute(setting_stmt)
-        setting = setting_result.scalar_one_or_none()
-        if setting:
-            require_approval = setting.value == "true"
+        require_approval = await get_require_user_approval(db)
 
     # Create user
     # First user: admin + active
     # Subsequent users: active status depends on require_approval setting
     user = User(
         email=email.lower().strip(),
-        hashed_password=hash_password(password),
+        hashed_password=await asyncio.to_thread(hash_password, password),
         is_admin=is_first_user,
         is_active=is_first_user or not require_approval
     )
@@ -185,7 +185,9 @@ async def register_user(email: str, password: str, db: AsyncSession) -> User:
     return user
 
 
-async def authenticate_user(email: str, password: str, db: AsyncSession) -> User | None:
+async def authenticate_user(
+    email: str, password: str, db: AsyncSession
+) -> tuple[User | None, str]:
     """
     Verify user credentials.
 
@@ -195,26 +197,30 @@ async def authenticate_user(email: str, password: str, db: AsyncSession) -> User
         db: Database session
 
     Returns:
-        User instance if credentials are valid, None otherwise
+        Tuple of (user, reason)
+        - user: User instance if credentials are valid and the account is active, None otherwise
+        - reason: "ok", "not_found", "bad_password" or "inactive"
     """
-    stmt = select(User).where(
-        User.email == email.lower().strip(),
-        User.is_active == True  # noqa: E712
-    )
+    stmt = select(User).where(User.email == email.lower().strip())
     result = await db.execute(stmt)
     user = result.scalar_one_or_none()
 
     if not user:
-        return None
+        # Verify against a dummy hash so unknown emails take as long as bad passwords
+        await asyncio.to_thread(verify_password, password, _DUMMY_HASH)
+        return None, "not_found"
 
     # Verify password
-    is_valid, new_hash = verify_password(password, user.hashed_password)
+    is_valid, new_hash = await asyncio.to_thread(verify_password, password, user.hashed_password)
     if not is_valid:
-        return None
+        return None, "bad_password"
+
+    if not user.is_active:
+        return None, "inactive"
 
     # Rehash if needed (Argon2 parameter update)
     if new_hash:
         user.hashed_password = new_hash
         await db.commit()
 
-    return user
+    return user, "ok"
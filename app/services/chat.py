@@ -1,9 +1,11 @@
+from datetime import timedelta
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.timezone import get_utc_now
 from app.models.podcast import Chat, ChatMessage, Episode
 from app.services.openai_client import get_chat_client
 from app.services.prompt_loader import render_prompt
@@ -108,6 +110,27 @@ async def save_chat_message(
     return message
 
 
+async def save_chat_messages(
+    db: AsyncSession, chat_id: UUID, messages: list[tuple[str, str]]
+) -> None:
+    """Save several (role, content) chat messages in one INSERT and one commit"""
+    # Offset timestamps so the messages keep their order when sorted by created_at
+    now = get_utc_now()
+    await db.execute(
+        insert(ChatMessage),
+        [
+            {
+                "chat_id": chat_id,
+                "role": role,
+                "content": content,
+                "created_at": now + timedelta(microseconds=i),
+            }
+            for i, (role, content) in enumerate(messages)
+        ],
+    )
+    await db.commit()
+
+
 async def update_chat_title(db: AsyncSession, chat_id: UUID, title: str):
     """Update the chat title"""
     result = await db.execute(select(Chat).where(Chat.id == chat_id))
@@ -0,0 +1,139 @@
+"""
+Push notification change events to connected clients.
+
+A single LISTEN connection per process receives the pg_notify events sent by the
+notifications trigger (app/migrations/add_notifications_notify_trigger.sql) and fans
+them out to per-user subscriber queues, so open browser tabs don't each hold a
+database connection.
+"""
+
+import asyncio
+import uuid
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.db.session import engine
+
+logger = structlog.get_logger(__name__)
+
+# Channel used by the notifications trigger; the payload is the affected user_id
+NOTIFICATIONS_CHANNEL = "notifications_changed"
+
+# user_id -> queues of the streams currently open for that user
+_subscribers: dict[uuid.UUID, set[asyncio.Queue]] = defaultdict(set)
+
+# Longest wait between attempts to restart a dead listener
+LISTENER_RETRY_MAX_SECONDS = 30
+# Keeps running recovery tasks referenced until they finish
+_recovery_tasks: set[asyncio.Task] = set()
+
+
+class _ListenerState:
+    """The process-wide LISTEN connection (None while stopped) and the lock that starts it"""
+
+    def __init__(self) -> None:
+        self.conn: AsyncConnection | None = None
+        self.lock = asyncio.Lock()
+
+
+_listener = _ListenerState()
+
+
+def _on_notify(_connection, _pid: int, _channel: str, payload: str) -> None:
+    """asyncpg listener callback - wake up the streams of the affected user"""
+    try:
+        user_id = uuid.UUID(payload)
+    except ValueError:
+        return
+
+    for queue in _subscribers.get(user_id, ()):
+        # Queues hold at most one pending wake-up; bursts of changes collapse into one event
+        if queue.empty():
+            queue.put_nowait(None)
+
+
+def _on_terminate(_connection) -> None:
+    """asyncpg termination callback - release the dead listener and start a new one"""
+    dead_conn, _listener.conn = _listener.conn, None
+    logger.warning("notification_listener_terminated")
+    task = asyncio.get_running_loop().create_task(_recover_listener(dead_conn))
+    _recovery_tasks.add(task)
+    task.add_done_callback(_recovery_tasks.discard)
+
+
+async def _recover_listener(dead_conn: AsyncConnection | None) -> None:
+    """Release the dead connection's pool slot, then re-LISTEN while anyone is subscribed"""
+    if dead_conn is not None:
+        try:
+            await dead_conn.invalidate()
+            await dead_conn.close()
+        except Exception as e:
+            logger.warning("notification_listener_close_failed", error=str(e))
+
+    delay = 1.0
+    while _subscribers:
+        try:
+            await _ensure_listener()
+            break
+        except Exception as e:
+            logger.warning("notification_listener_restart_failed", error=str(e), retry_in=delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, LISTENER_RETRY_MAX_SECONDS)
+    else:
+        return
+
+    # Changes made while the listener was down were never announced - have every open
+    # stream re-send its listing
+    for queues in _subscribers.values():
+        for queue in queues:
+            if queue.empty():
+                queue.put_nowait(None)
+
+
+async def _ensure_listener() -> None:
+    """Start the process-wide LISTEN connection if it isn't running"""
+    if _listener.conn is not None:
+        return
+
+    async with _listener.lock:
+        if _listener.conn is not None:
+            return
+
+        conn = await engine.connect()
+        try:
+            raw = await conn.get_raw_connection()
+            driver_conn = raw.driver_connection
+            await driver_conn.add_listener(NOTIFICATIONS_CHANNEL, _on_notify)
+            driver_conn.add_termination_listener(_on_terminate)
+        except Exception:
+            await conn.close()
+            raise
+        _listener.conn = conn
+        logger.info("notification_listener_started", channel=NOTIFICATIONS_CHANNEL)
+
+
+@asynccontextmanager
+async def subscribe(user_id: uuid.UUID) -> AsyncIterator[asyncio.Queue]:
+    """
+    Subscribe to notification changes for a user.
+
+    Args:
+        user_id: User whose notifications to watch
+
+    Yields:
+        Queue that receives an item whenever the user's notifications change
+    """
+    await _ensure_listener()
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+    _subscribers[user_id].add(queue)
+    try:
+        yield queue
+    finally:
+        _subscribers[user_id].discard(queue)
+        if not _subscribers[user_id]:
+            del _subscribers[user_id]
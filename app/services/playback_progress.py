@@ -0,0 +1,160 @@
+"""
+Write-behind buffer for playback progress.
+
+Players save their position every few seconds, but it is only read back when an
+episode is resumed. Saves go to a Redis hash and are flushed to the
+playback_progress table in bulk by the flush_playback_progress beat task, so each
+tick costs a Redis HSET instead of a Postgres commit.
+"""
+
+import uuid
+from datetime import datetime
+
+import orjson
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.podcast import Episode, PlaybackProgress
+from app.models.user import User
+
+logger = structlog.get_logger(__name__)
+
+# Hash of unflushed positions: "{user_id}:{episode_id}" -> {"current_time", "last_updated"}
+PENDING_KEY = "playback_progress:pending"
+# The pending hash is renamed here while a flush writes it out, so new saves start a fresh hash
+FLUSHING_KEY = "playback_progress:flushing"
+
+
+def _field(user_id: uuid.UUID, episode_id: uuid.UUID) -> str:
+    return f"{user_id}:{episode_id}"
+
+
+async def save_progress(
+    redis: Redis, user_id: uuid.UUID, episode_id: uuid.UUID, current_time: int, now: datetime
+) -> None:
+    """Buffer a user's position in an episode until the next flush"""
+    value = orjson.dumps({"current_time": current_time, "last_updated": now.isoformat()})
+    await redis.hset(PENDING_KEY, _field(user_id, episode_id), value)
+
+
+async def get_buffered_progress(
+    redis: Redis, user_id: uuid.UUID, episode_id: uuid.UUID
+) -> dict | None:
+    """
+    Get a position that hasn't been flushed to the database yet.
+
+    Returns:
+        Dict with current_time and last_updated (ISO string), or None if nothing is buffered
+    """
+    field = _field(user_id, episode_id)
+    value = await redis.hget(PENDING_KEY, field) or await redis.hget(FLUSHING_KEY, field)
+    return orjson.loads(value) if value is not None else None
+
+
+async def discard_progress(redis: Redis, user_id: uuid.UUID, episode_id: uuid.UUID) -> None:
+    """Drop a buffered position (the episode was finished)"""
+    field = _field(user_id, episode_id)
+    await redis.hdel(PENDING_KEY, field)
+    await redis.hdel(FLUSHING_KEY, field)
+
+
+async def flush_progress(redis: Redis, db: AsyncSession) -> int:
+    """
+    Write all buffered positions to the playback_progress table.
+
+    Args:
+        redis: Redis connection
+        db: Database session
+
+    Returns:
+        Number of positions written
+    """
+    # A leftover flushing hash means the previous flush failed - write it out before taking more
+    if not await redis.exists(FLUSHING_KEY):
+        try:
+            await redis.rename(PENDING_KEY, FLUSHING_KEY)
+        except ResponseError:
+            # Nothing buffered (RENAME fails on a missing key)
+            return 0
+
+    buffered = await redis.hgetall(FLUSHING_KEY)
+    rows = []
+    for field, value in buffered.items():
+        row = _parse_buffered(field, value)
+        if row is None:
+            # One malformed entry must not block everyone else's positions
+            logger.warning("playback_progress_entry_dropped", field=field.decode(errors="replace"))
+            continue
+        rows.append(row)
+
+    if rows:
+        # Skip positions whose episode or user was deleted since they were saved
+        episode_ids = await db.scalars(
+            select(Episode.id).where(Episode.id.in_({row["episode_id"] for row in rows}))
+        )
+        user_ids = await db.scalars(
+            select(User.id).where(User.id.in_({row["user_id"] for row in rows}))
+        )
+        live_episodes, live_users = set(episode_ids), set(user_ids)
+        rows = [
+            row for row in rows
+            if row["episode_id"] in live_episodes and row["user_id"] in live_users
+        ]
+
+    if rows:
+        stmt = postgresql.insert(PlaybackProgress)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PlaybackProgress.episode_id, PlaybackProgress.user_id],
+            set_={
+                "current_time": stmt.excluded.current_time,
+                "last_updated": stmt.excluded.last_updated,
+            },
+        )
+        await db.execute(stmt, rows)
+        await db.commit()
+
+        # discard_progress removes its field from the flushing hash before deleting the stored
+        # row; a field gone by now was discarded mid-flush, and the upsert above may have put
+        # its row back - delete exactly the rows this flush wrote for those fields
+        still_buffered = await redis.hmget(
+            FLUSHING_KEY, [_field(row["user_id"], row["episode_id"]) for row in rows]
+        )
+        discarded = [row for row, value in zip(rows, still_buffered, strict=True) if value is None]
+        if discarded:
+            await db.execute(
+                delete(PlaybackProgress).where(
+                    tuple_(
+                        PlaybackProgress.user_id,
+                        PlaybackProgress.episode_id,
+                        PlaybackProgress.last_updated,
+                    ).in_([(r["user_id"], r["episode_id"], r["last_updated"]) for r in discarded])
+                )
+            )
+            await db.commit()
+
+    await redis.delete(FLUSHING_KEY)
+    logger.info("playback_progress_flushed", count=len(rows), buffered=len(buffered))
+    return len(rows)
+
+
+def _parse_buffered(field: bytes, value: bytes) -> dict | None:
+    """Decode one buffered entry into an upsert row, or None if it is malformed"""
+    try:
+        user_id, episode_id = field.decode().split(":")
+        data = orjson.loads(value)
+        current_time = data["current_time"]
+        # bool is an int subclass; anything else would fail the whole batch insert
+        if type(current_time) is not int or not 0 <= current_time <= 2_147_483_647:
+            return None
+        return {
+            "user_id": uuid.UUID(user_id),
+            "episode_id": uuid.UUID(episode_id),
+            "current_time": current_time,
+            "last_updated": datetime.fromisoformat(data["last_updated"]),
+        }
+    except (ValueError, KeyError, TypeError, orjson.JSONDecodeError):
+        return None
@@ -1,4 +1,5 @@
 from app.tasks.data_import import import_data_task
 from app.tasks.episode_processing import process_episode_task
+from app.tasks.playback_progress import flush_playback_progress
 
-__all__ = ["import_data_task", "process_episode_task"]
+__all__ = ["flush_playback_progress", "import_data_task", "process_episode_task"]
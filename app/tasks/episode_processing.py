@@ -556,6 +556,7 @@ def process_episode_task(self, episode_id: str):
             from app.api.podcasts import update_podcast_counts
 
             await update_podcast_counts(episode.podcast_id, db)
+            await db.commit()
 
             # Update task history as complete
             await update_task_history(self.request.id, "SUCCESS", completed=True)
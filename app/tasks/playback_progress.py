@@ -0,0 +1,29 @@
+import asyncio
+
+import structlog
+from redis.asyncio import Redis
+
+from app.celery_app import celery_app
+from app.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+@celery_app.task(name="flush_playback_progress")
+def flush_playback_progress():
+    """Periodic task that writes buffered playback positions from Redis to the database"""
+    from app.services.playback_progress import flush_progress
+    from app.tasks.episode_processing import get_task_session_maker
+
+    async def _flush():
+        # Fresh clients - connections must belong to this task's event loop
+        redis = Redis.from_url(settings.redis_url)
+        session_maker = get_task_session_maker()
+        try:
+            async with session_maker() as db:
+                return {"flushed": await flush_progress(redis, db)}
+        finally:
+            await redis.aclose()
+            await session_maker.kw["bind"].dispose()
+
+    return asyncio.run(_flush())
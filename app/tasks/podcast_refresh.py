@@ -35,6 +35,7 @@ def refresh_all_podcasts_scheduled():
 
                     # Update episodes
                     await fetch_episodes(podcast.id, podcast.rss_url, db)
+                    await db.commit()
                     updated_count += 1
                 except Exception as e:
                     logger.error("podcast_refresh_failed", podcast_id=str(podcast.id), podcast_title=podcast.title, error=str(e))
@@ -6,9 +6,13 @@ import Link from 'next/link'
 import { formatDuration } from '@/lib/duration-utils'
 import { useTaskMonitor } from '@/hooks/useTaskMonitor'
 
+const PAGE_SIZE = 50
+
 export default function AIEnhancedPage() {
   const [episodes, setEpisodes] = useState<any[]>([])
   const [loading, setLoading] = useState(true)
+  const [loadingMore, setLoadingMore] = useState(false)
+  const [hasMore, setHasMore] = useState(false)
   const [search, setSearch] = useState('')
   const [sort, setSort] = useState('processed_desc')
   const [searchMode, setSearchMode] = useState<'semantic' | 'text'>('semantic')
@@ -38,10 +42,12 @@ export default function AIEnhancedPage() {
       if (searchMode === 'semantic' && search && search.trim()) {
         const data = await api.semanticSearchEpisodes(search, 20)
         setEpisodes(data)
+        setHasMore(false)
       } else {
-        // Fall back to text search
-        const data = await api.getProcessedEpisodes(search || undefined, sort)
+        // Fall back to text search - first page only, the rest loads on demand
+        const data = await api.getProcessedEpisodes(search || undefined, sort, PAGE_SIZE)
         setEpisodes(data)
+        setHasMore(data.length === PAGE_SIZE)
       }
     } catch (error) {
       console.error('Failed to load episodes:', error)
@@ -50,6 +56,19 @@ export default function AIEnhancedPage() {
     }
   }
 
+  const loadMoreEpisodes = async () => {
+    try {
+      setLoadingMore(true)
+      const data = await api.getProcessedEpisodes(search || undefined, sort, PAGE_SIZE, episodes.length)
+      setEpisodes([...episodes, ...data])
+      setHasMore(data.length === PAGE_SIZE)
+    } catch (error) {
+      console.error('Failed to load more episodes:', error)
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
   return (
     <div className="min-h-screen">
       <div className="max-w-6xl mx-auto p-8">
@@ -207,6 +226,18 @@ export default function AIEnhancedPage() {
             ))
           )}
         </div>
+
+        {!loading && hasMore && (
+          <div className="mt-6 text-center">
+            <button
+              onClick={loadMoreEpisodes}
+              disabled={loadingMore}
+              className="px-4 py-2 rounded-lg text-sm font-medium bg-gray-200 dark:bg-gray-700 text-gray-700 dark:text-gray-300 hover:bg-gray-300 dark:hover:bg-gray-600 disabled:opacity-50 transition-colors"
+            >
+              {loadingMore ? 'Loading...' : 'Load more'}
+            </button>
+          </div>
+        )}
       </div>
     </div>
   )
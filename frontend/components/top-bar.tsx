@@ -3,6 +3,7 @@
 import { useState, useEffect, useRef } from 'react'
 import { useRouter } from 'next/navigation'
 import { api, Notification } from '@/lib/api'
+import { formatTimeAgo } from '@/lib/duration-utils'
 import { ThemeToggle } from './theme-toggle'
 import { useAuth } from '@/contexts/auth-context'
 
@@ -17,9 +18,24 @@ export function TopBar() {
   const dropdownRef = useRef<HTMLDivElement>(null)
 
   useEffect(() => {
-    loadNotifications()
-    const interval = setInterval(loadNotifications, 20000) // Poll every 20 seconds
-    return () => clearInterval(interval)
+    let interval: ReturnType<typeof setInterval> | undefined
+    // Push updates over SSE; fall back to polling every 20 seconds if the stream fails
+    const unsubscribe = api.subscribeNotifications(
+      (data) => {
+        setNotifications(data.notifications)
+        setUnreadCount(data.unread_count)
+      },
+      () => {
+        if (!interval) {
+          loadNotifications()
+          interval = setInterval(loadNotifications, 20000)
+        }
+      },
+    )
+    return () => {
+      unsubscribe()
+      if (interval) clearInterval(interval)
+    }
   }, [])
 
   useEffect(() => {
@@ -151,7 +167,7 @@ export function TopBar() {
                           {notification.message}
                         </div>
                         <div className="text-xs text-gray-500 mt-1">
-                          {notification.time_ago}
+                          {formatTimeAgo(notification.created_at)}
                         </div>
                       </div>
                       {notification.read === 0 && (
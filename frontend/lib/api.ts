@@ -108,7 +108,6 @@ export interface Notification {
   podcast_id?: string
   read: number
   created_at: string
-  time_ago: string
 }
 
 class ApiClient {
@@ -184,10 +183,12 @@ class ApiClient {
     return this.request(`/api/podcasts/processed${query ? `?${query}` : ''}`)
   }
 
-  async getProcessedEpisodes(search?: string, sort?: string): Promise<any[]> {
+  async getProcessedEpisodes(search?: string, sort?: string, limit?: number, offset?: number): Promise<any[]> {
     const params = new URLSearchParams()
     if (search) params.append('search', search)
     if (sort) params.append('sort', sort)
+    if (limit) params.append('limit', limit.toString())
+    if (offset) params.append('offset', offset.toString())
 
     const query = params.toString()
     return this.request(`/api/podcasts/episodes/processed${query ? `?${query}` : ''}`)
@@ -462,10 +463,34 @@ class ApiClient {
     return this.request('/api/notifications')
   }
 
+  // Server-sent events: receives the notifications listing on connect and on every change.
+  // Returns a function that closes the stream.
+  subscribeNotifications(
+    onData: (data: { notifications: Notification[]; unread_count: number }) => void,
+    onError: () => void,
+  ): () => void {
+    const source = new EventSource(`${API_BASE}/api/notifications/stream`, { withCredentials: true })
+    source.addEventListener('notifications', (event) => {
+      onData(JSON.parse((event as MessageEvent).data))
+    })
+    source.onerror = () => {
+      source.close()
+      onError()
+    }
+    return () => source.close()
+  }
+
   async markNotificationRead(id: string): Promise<void> {
-    await fetch(`${API_BASE}/api/notifications/${id}/read`, {
+    await this.markNotificationsRead([id])
+  }
+
+  async markNotificationsRead(ids: string[]): Promise<void> {
+    if (ids.length === 0) return
+    await fetch(`${API_BASE}/api/notifications/read`, {
       credentials: "include",
       method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify(ids),
     })
   }
 
@@ -12,3 +12,17 @@ export function formatDuration(seconds: number): string {
   }
   return `${minutes}m`
 }
+
+/**
+ * Format an ISO timestamp as a relative time string (e.g., "just now", "5m ago", "3d ago")
+ * Timestamps older than a week are displayed as a short date (e.g., "Oct 05")
+ */
+export function formatTimeAgo(isoTimestamp: string, now: number = Date.now()): string {
+  const date = new Date(isoTimestamp)
+  const seconds = Math.floor((now - date.getTime()) / 1000)
+  if (seconds < 60) return 'just now'
+  if (seconds < 3600) return `${Math.floor(seconds / 60)}m ago`
+  if (seconds < 86400) return `${Math.floor(seconds / 3600)}h ago`
+  if (seconds < 604800) return `${Math.floor(seconds / 86400)}d ago`
+  return date.toLocaleDateString('en-US', { month: 'short', day: '2-digit', timeZone: 'UTC' })
+}